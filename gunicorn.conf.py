@@ -0,0 +1,28 @@
+"""
+Gunicorn settings for the LangSmith web dashboard.
+
+    gunicorn -c gunicorn.conf.py "src.orchestrator.monitoring.langsmith_web_dashboard:create_app()"
+
+The dashboard keeps its monitor, response cache and refresh thread in process
+memory, so it runs as a single worker and gets its concurrency from threads.
+Extra worker processes would each hold a separate, diverging copy of that
+state. SSE clients on /api/stream each hold one thread, so size ``threads``
+for the expected number of open dashboards plus API traffic.
+"""
+
+import os
+
+bind = os.getenv("DASHBOARD_BIND", "0.0.0.0:8081")
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("DASHBOARD_THREADS", "16"))
+# /api/stream responses stay open; keep-alive comments arrive every 15 seconds
+timeout = 60
+keepalive = 5
+
+
+def post_worker_init(worker):
+    # Threads do not survive fork, so start the refresher inside the worker
+    from src.orchestrator.monitoring.langsmith_web_dashboard import start_background_refresh
+
+    start_background_refresh()
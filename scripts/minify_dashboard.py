@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Minify the LangSmith dashboard page served by langsmith_web_dashboard.py.
+
+Reads src/orchestrator/monitoring/static/enhanced_dashboard.html and writes
+enhanced_dashboard.min.html next to it. Re-run after editing the page:
+
+    python scripts/minify_dashboard.py
+
+The transform is deliberately conservative so it needs nothing beyond the
+standard library: comments are dropped and indentation/blank lines removed,
+but line breaks are kept so inline JavaScript never depends on semicolon
+insertion across joined lines.
+"""
+
+import re
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "src" / "orchestrator" / "monitoring" / "static"
+SOURCE = STATIC_DIR / "enhanced_dashboard.html"
+TARGET = STATIC_DIR / "enhanced_dashboard.min.html"
+
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+STYLE_BLOCK = re.compile(r"(<style>)(.*?)(</style>)", re.DOTALL)
+SCRIPT_BLOCK = re.compile(r"(<script>)(.*?)(</script>)", re.DOTALL)
+CSS_PUNCTUATION = re.compile(r"\s*([{};:,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    css = CSS_COMMENT.sub("", css)
+    css = " ".join(css.split())
+    return CSS_PUNCTUATION.sub(r"\1", css).replace(";}", "}")
+
+
+def _minify_js(js: str) -> str:
+    lines = []
+    for line in js.splitlines():
+        line = line.strip()
+        # Only whole-line comments are dropped; "//" inside strings is left alone
+        if line and not line.startswith("//"):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def minify(html: str) -> str:
+    """Return a minified copy of the dashboard page."""
+    html = STYLE_BLOCK.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+    scripts = []
+
+    def _stash(match):
+        scripts.append(match.group(1) + _minify_js(match.group(2)) + match.group(3))
+        return f"\x00{len(scripts) - 1}\x00"
+
+    # Keep scripts out of the HTML pass so comment-like text in JS is untouched
+    html = SCRIPT_BLOCK.sub(_stash, html)
+    html = HTML_COMMENT.sub("", html)
+    html = "\n".join(line.strip() for line in html.splitlines() if line.strip())
+    return re.sub(r"\x00(\d+)\x00", lambda m: scripts[int(m.group(1))], html) + "\n"
+
+
+def main():
+    source = SOURCE.read_text(encoding="utf-8")
+    minified = minify(source)
+    TARGET.write_text(minified, encoding="utf-8")
+    print(f"Wrote {TARGET.name}: {len(source.encode())} -> {len(minified.encode())} bytes")
+
+
+if __name__ == "__main__":
+    main()
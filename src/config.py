@@ -26,6 +26,22 @@ IH_CACHE_MAX_AGE_HOURS: int = int(os.getenv("IH_CACHE_MAX_AGE_HOURS", 24))
 # exceeded, the oldest entries are pruned (LRU strategy).
 IH_CACHE_MAX_ITEMS: int = int(os.getenv("IH_CACHE_MAX_ITEMS", 1000))
 
+# SQLite file for the persistent embedding cache used by ``EmbeddingNode``
+# (see ``src/orchestrator/nodes/embedding.py``). Empty disables the cache.
+IH_EMBEDDING_CACHE_PATH: str = os.getenv("IH_EMBEDDING_CACHE_PATH", "")
+
+# Maximum number of cached embeddings; least recently used entries are
+# pruned beyond this.
+IH_EMBEDDING_CACHE_MAX_ITEMS: int = int(os.getenv("IH_EMBEDDING_CACHE_MAX_ITEMS", 10000))
+
+# Maximum DeepSeek requests in flight per account across the whole process
+# from ``SummarizerNode``'s async paths, shared by all worker threads and event
+# loops. Keep within the account's concurrency quota to avoid 429s.
+DEEPSEEK_CONCURRENCY: int = int(os.getenv("DEEPSEEK_CONCURRENCY", 8))
+
+# Worker threads in the process-wide pool ``ParallelProcessor`` runs nodes on.
+PARALLEL_NODE_WORKERS: int = int(os.getenv("PARALLEL_NODE_WORKERS", 4))
+
 # Minutes between automatic metrics-driven tuning cycles. Default 30.
 METRICS_TUNE_INTERVAL_MIN: int = int(os.getenv("METRICS_TUNE_INTERVAL_MIN", 30))
 
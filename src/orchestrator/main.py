@@ -296,6 +296,10 @@ class Orchestrator:
         self._stop_requested = False
         self._current_progress = ProcessingProgress()
         self._progress_lock = Lock()
+        # Node instances for the optimizer path, built on first use and shared
+        # across items so their API clients and connections are reused
+        self._optimized_nodes: Optional[Dict[str, Callable]] = None
+        self._optimized_nodes_lock = Lock()
         self.retry_manager = RetryManager(self.config.retry_config)
         
         # Initialize circuit breakers for different services
@@ -326,18 +330,7 @@ class Orchestrator:
         # Route through the new optimization pipeline when enabled.
         if self.config.enable_optimizations:
             try:
-                # Build mapping between node names and callables, mirroring
-                # the LangGraph structure.  This decouples the optimizer
-                # from the LangGraph dependency.
-                storage_node_instance = StorageNode()
-
-                nodes = {
-                    "content_fetcher": ContentFetcherNode(),
-                    "summarizer": SummarizerNode(),
-                    "embedding": EmbeddingNode(),
-                    "storage": lambda st: storage_node_instance.store_content(st),
-                }
-
+                nodes = self._get_optimized_nodes()
                 return asyncio.run(get_optimizer().process_with_optimizations(content_state, nodes))
             except Exception as opt_err:
                 logger.warning(f"Optimizer execution failed, falling back: {opt_err}")
@@ -346,6 +339,27 @@ class Orchestrator:
         
         return self._process_content_with_retry(content_state)
     
+    def _get_optimized_nodes(self) -> Dict[str, Callable]:
+        """Return the node mapping used by the optimizer path, creating it once.
+        
+        The mapping mirrors the LangGraph structure, which decouples the
+        optimizer from the LangGraph dependency. Reusing the instances keeps
+        the Supabase/OpenAI clients, their HTTP connections and loaded models
+        warm across items instead of rebuilding them per item. A failed build
+        (e.g. Supabase not configured) is not cached, so it is retried on the
+        next item.
+        """
+        with self._optimized_nodes_lock:
+            if self._optimized_nodes is None:
+                storage_node_instance = StorageNode()
+                self._optimized_nodes = {
+                    "content_fetcher": ContentFetcherNode(),
+                    "summarizer": SummarizerNode(summary_cache=get_optimizer().cache),
+                    "embedding": EmbeddingNode(),
+                    "storage": lambda st: storage_node_instance.store_content(st),
+                }
+            return self._optimized_nodes
+    
     def _process_content_with_retry(self, content_state: ContentState) -> ContentState:
         """
         Process content with retry logic and circuit breaker protection.
@@ -5,7 +5,6 @@ Provides performance tracking, error monitoring, and dashboard functionality
 that works independently of LangSmith API permissions.
 """
 
-import json
 import time
 import threading
 from datetime import datetime, timedelta
@@ -16,10 +15,10 @@ import statistics
 import uuid
 import logging
 
+import orjson
+
 from .metrics import NodeMetrics, WorkflowMetrics
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class LocalMonitoringDashboard:
@@ -47,6 +46,18 @@ class LocalMonitoringDashboard:
             "success_rate": 0
         })
         
+        # Rolling aggregates maintained as workflows enter/leave ``recent_workflows``
+        # so dashboard consumers don't have to rescan the deque on every call.
+        self._last20_errors: deque = deque(maxlen=20)
+        self._last20_error_count = 0
+        self._success_duration_sum = 0.0
+        self._success_duration_count = 0
+        
+        # Change notification: the version is bumped whenever dashboard-visible
+        # state changes so that push/caching consumers can wait on it.
+        self._version = 0
+        self._changed = threading.Condition()
+        
         # Load existing data
         self._load_data()
         
@@ -58,15 +69,13 @@ class LocalMonitoringDashboard:
         try:
             workflows_file = self.data_dir / "workflows.json"
             if workflows_file.exists():
-                with open(workflows_file, 'r') as f:
-                    data = json.load(f)
-                    for workflow_data in data[-1000:]:  # Load last 1000
-                        try:
-                            workflow = WorkflowMetrics.from_dict(workflow_data)
-                            self.recent_workflows.append(workflow)
-                            self._update_node_stats(workflow)
-                        except Exception as e:
-                            logger.warning(f"Failed to load workflow data: {e}")
+                data = orjson.loads(workflows_file.read_bytes())
+                for workflow_data in data[-1000:]:  # Load last 1000
+                    try:
+                        workflow = WorkflowMetrics.from_dict(workflow_data)
+                        self._record_workflow(workflow)
+                    except Exception as e:
+                        logger.warning(f"Failed to load workflow data: {e}")
             
             logger.info(f"Loaded {len(self.recent_workflows)} workflow records")
             
@@ -78,16 +87,14 @@ class LocalMonitoringDashboard:
         try:
             workflows_file = self.data_dir / "workflows.json"
             
-            # Convert workflows to serializable format
+            # Encode straight to bytes; orjson is far cheaper than json.dump
+            # for the up to 1000 workflows written on every auto-save
             serializable_workflows = [workflow.to_dict() for workflow in self.recent_workflows]
-            
-            with open(workflows_file, 'w') as f:
-                json.dump(serializable_workflows, f, indent=2)
+            workflows_file.write_bytes(orjson.dumps(serializable_workflows, option=orjson.OPT_INDENT_2))
             
             # Save aggregated stats
             stats_file = self.data_dir / "node_stats.json"
-            with open(stats_file, 'w') as f:
-                json.dump(dict(self.node_stats), f, indent=2)
+            stats_file.write_bytes(orjson.dumps(dict(self.node_stats), option=orjson.OPT_INDENT_2))
                 
         except Exception as e:
             logger.error(f"Failed to save monitoring data: {e}")
@@ -102,6 +109,27 @@ class LocalMonitoringDashboard:
         save_thread = threading.Thread(target=save_periodically, daemon=True)
         save_thread.start()
     
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever workflows or nodes start or complete."""
+        return self._version
+    
+    def _notify_change(self) -> None:
+        """Bump the data version and wake any waiting subscribers."""
+        with self._changed:
+            self._version += 1
+            self._changed.notify_all()
+    
+    def wait_for_change(self, since: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        """Block until the data version differs from ``since`` or ``timeout`` elapses.
+        
+        Returns the current version; pass ``since=None`` to return immediately.
+        """
+        with self._changed:
+            if since is not None and since == self._version:
+                self._changed.wait(timeout)
+            return self._version
+    
     def start_workflow(self, content_type: str = "unknown") -> str:
         """Start monitoring a new workflow."""
         workflow_id = str(uuid.uuid4())
@@ -112,6 +140,7 @@ class LocalMonitoringDashboard:
         )
         self.active_workflows[workflow_id] = workflow
         logger.info(f"Started monitoring workflow {workflow_id} ({content_type})")
+        self._notify_change()
         return workflow_id
     
     def start_node(self, workflow_id: str, node_name: str, input_size: Optional[int] = None) -> str:
@@ -130,6 +159,7 @@ class LocalMonitoringDashboard:
             self.active_workflows[workflow_id].add_node(node_metrics)
         
         logger.debug(f"Started monitoring node {node_name} (execution: {execution_id})")
+        self._notify_change()
         return execution_id
     
     def complete_node(self, execution_id: str, status: str = "success", 
@@ -144,6 +174,7 @@ class LocalMonitoringDashboard:
             
             logger.debug(f"Completed monitoring node {node.node_name} ({execution_id}): {status} in {node.duration:.2f}s")
             del self.active_nodes[execution_id]
+            self._notify_change()
     
     def complete_workflow(self, workflow_id: str, status: str = "success", 
                          error_message: Optional[str] = None, 
@@ -156,11 +187,39 @@ class LocalMonitoringDashboard:
             workflow.total_cost = total_cost
             
             # Move to recent workflows
-            self.recent_workflows.append(workflow)
-            self._update_node_stats(workflow)
+            self._record_workflow(workflow)
             
             logger.info(f"Completed monitoring workflow {workflow_id}: {status} in {workflow.duration:.2f}s")
             del self.active_workflows[workflow_id]
+            self._notify_change()
+    
+    def _record_workflow(self, workflow: WorkflowMetrics) -> None:
+        """Append a finished workflow and update the rolling aggregates."""
+        if len(self.recent_workflows) == self.recent_workflows.maxlen:
+            evicted = self.recent_workflows[0]
+            if evicted.status == "success" and evicted.duration:
+                self._success_duration_sum -= evicted.duration
+                self._success_duration_count -= 1
+        self.recent_workflows.append(workflow)
+        
+        if workflow.status == "success" and workflow.duration:
+            self._success_duration_sum += workflow.duration
+            self._success_duration_count += 1
+        
+        failed = workflow.status != "success"
+        if len(self._last20_errors) == self._last20_errors.maxlen:
+            self._last20_error_count -= self._last20_errors[0]
+        self._last20_errors.append(failed)
+        self._last20_error_count += failed
+        
+        self._update_node_stats(workflow)
+    
+    @property
+    def avg_success_duration(self) -> Optional[float]:
+        """Mean duration of successful workflows in ``recent_workflows``."""
+        if not self._success_duration_count:
+            return None
+        return self._success_duration_sum / self._success_duration_count
     
     def _update_node_stats(self, workflow: WorkflowMetrics):
         """Update aggregated node statistics."""
@@ -191,8 +250,10 @@ class LocalMonitoringDashboard:
         total_workflows = len(self.recent_workflows)
         successful_workflows = len([w for w in self.recent_workflows if w.status == "success"])
         
+        # Timestamps are epoch milliseconds: compact, and the browser's
+        # new Date(ms) needs no string parsing or timezone guessing
         dashboard_data = {
-            "timestamp": now.isoformat(),
+            "timestamp": int(now.timestamp() * 1000),
             "overview": {
                 "total_workflows": total_workflows,
                 "successful_workflows": successful_workflows,
@@ -212,7 +273,7 @@ class LocalMonitoringDashboard:
                     "content_type": w.content_type,
                     "duration": w.duration,
                     "status": w.status,
-                    "start_time": w.start_time.isoformat(),
+                    "start_time": int(w.start_time.timestamp() * 1000),
                     "total_tokens": w.total_tokens,
                     "total_cost": w.total_cost
                 }
@@ -269,13 +330,13 @@ class LocalMonitoringDashboard:
                 })
         
         # Check recent failures
-        recent_failures = [w for w in list(self.recent_workflows)[-20:] if w.status != "success"]
-        if len(recent_failures) >= 3:
+        recent_failures = self._last20_error_count
+        if recent_failures >= 3:
             alerts.append({
                 "level": "error",
                 "type": "recent_failures", 
-                "message": f"{len(recent_failures)} failures in last 20 workflows",
-                "value": len(recent_failures)
+                "message": f"{recent_failures} failures in last 20 workflows",
+                "value": recent_failures
             })
         
         return alerts
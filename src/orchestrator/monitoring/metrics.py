@@ -3,11 +3,14 @@
 Metrics data structures for monitoring orchestrator performance.
 """
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True)
 class NodeMetrics:
     """Metrics for a single node execution."""
     node_name: str
@@ -19,23 +22,51 @@ class NodeMetrics:
     input_size: Optional[int] = None
     output_size: Optional[int] = None
     error_message: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # ISO strings are computed on first serialization and reused afterwards
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Monotonic reading taken at construction; complete() times from here, as
+    # metrics objects are created when the execution starts
+    _mono_start: float = field(default=0.0, init=False, repr=False, compare=False)
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
+        self._mono_start = time.monotonic()
+        # Older saved records may carry an explicit null
         if self.metadata is None:
             self.metadata = {}
     
-    def complete(self, status: str = "success", error_message: Optional[str] = None, metadata: Dict[str, Any] = None):
+    def complete(self, status: str = "success", error_message: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Mark the node execution as complete."""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self.duration = time.monotonic() - self._mono_start
+        self.end_time = self.start_time + timedelta(seconds=self.duration)
+        self._end_iso = None
         self.status = status
         if error_message:
             self.error_message = error_message
         if metadata:
             self.metadata.update(metadata)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary with ISO formatted dates."""
+        if self._start_iso is None:
+            self._start_iso = self.start_time.isoformat()
+        if self._end_iso is None and self.end_time:
+            self._end_iso = self.end_time.isoformat()
+        return {
+            'node_name': self.node_name,
+            'execution_id': self.execution_id,
+            'start_time': self._start_iso,
+            'end_time': self._end_iso,
+            'duration': self.duration,
+            'status': self.status,
+            'input_size': self.input_size,
+            'output_size': self.output_size,
+            'error_message': self.error_message,
+            'metadata': dict(self.metadata),
+        }
 
-@dataclass 
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Metrics for a complete workflow execution."""
     workflow_id: str
@@ -44,85 +75,131 @@ class WorkflowMetrics:
     duration: Optional[float] = None
     status: str = "running"
     content_type: str = "unknown"  # youtube, reddit
-    nodes: List[NodeMetrics] = None
+    nodes: List[NodeMetrics] = field(default_factory=list)
     total_tokens: int = 0
     total_cost: float = 0.0
     error_message: Optional[str] = None
+    # ISO strings are computed on first serialization and reused afterwards
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Monotonic reading taken at construction; complete() times from here, as
+    # metrics objects are created when the execution starts
+    _mono_start: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Serialized form of a finished workflow, which no longer changes
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
+        self._mono_start = time.monotonic()
+        # Older saved records may carry an explicit null
         if self.nodes is None:
             self.nodes = []
     
-    def add_node(self, node_metrics: NodeMetrics):
+    def add_node(self, node_metrics: NodeMetrics) -> None:
         """Add node metrics to the workflow."""
         self.nodes.append(node_metrics)
+        self._dict_cache = None
     
-    def complete(self, status: str = "success", error_message: Optional[str] = None):
+    def complete(self, status: str = "success", error_message: Optional[str] = None) -> None:
         """Mark the workflow as complete."""
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self.duration = time.monotonic() - self._mono_start
+        self.end_time = self.start_time + timedelta(seconds=self.duration)
+        self._end_iso = None
+        self._dict_cache = None
         self.status = status
         if error_message:
             self.error_message = error_message
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary with ISO formatted dates."""
-        data = asdict(self)
-        data['start_time'] = self.start_time.isoformat()
-        if self.end_time:
-            data['end_time'] = self.end_time.isoformat()
-        
-        # Convert node datetime objects
-        for node_dict in data['nodes']:
-            if isinstance(node_dict['start_time'], datetime):
-                node_dict['start_time'] = node_dict['start_time'].isoformat()
-            if node_dict.get('end_time') and isinstance(node_dict['end_time'], datetime):
-                node_dict['end_time'] = node_dict['end_time'].isoformat()
+        """Convert to dictionary with ISO formatted dates.
         
+        Finished workflows return the same cached dict on every call, so
+        callers must treat the result as read-only.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        if self._start_iso is None:
+            self._start_iso = self.start_time.isoformat()
+        if self._end_iso is None and self.end_time:
+            self._end_iso = self.end_time.isoformat()
+        data = {
+            'workflow_id': self.workflow_id,
+            'start_time': self._start_iso,
+            'end_time': self._end_iso,
+            'duration': self.duration,
+            'status': self.status,
+            'content_type': self.content_type,
+            'nodes': [node.to_dict() for node in self.nodes],
+            'total_tokens': self.total_tokens,
+            'total_cost': self.total_cost,
+            'error_message': self.error_message,
+        }
+        if self.status != "running":
+            self._dict_cache = data
         return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowMetrics':
         """Create from dictionary with ISO formatted dates."""
-        # Convert ISO strings back to datetime objects
-        workflow = cls(**data)
-        workflow.start_time = datetime.fromisoformat(data['start_time'])
-        if data.get('end_time'):
-            workflow.end_time = datetime.fromisoformat(data['end_time'])
-        
-        # Convert node datetime objects
-        workflow.nodes = []
-        for node_data in data.get('nodes', []):
-            node = NodeMetrics(**node_data)
-            node.start_time = datetime.fromisoformat(node_data['start_time'])
-            if node_data.get('end_time'):
-                node.end_time = datetime.fromisoformat(node_data['end_time'])
-            workflow.nodes.append(node)
-        
-        return workflow 
+        # Parse ISO strings up front so each object is constructed exactly once
+        fields = dict(data)
+        fields['start_time'] = datetime.fromisoformat(fields['start_time'])
+        if fields.get('end_time'):
+            fields['end_time'] = datetime.fromisoformat(fields['end_time'])
+        fields['nodes'] = [
+            NodeMetrics(**{
+                **node_data,
+                'start_time': datetime.fromisoformat(node_data['start_time']),
+                'end_time': datetime.fromisoformat(node_data['end_time']) if node_data.get('end_time') else None,
+            })
+            for node_data in fields.get('nodes') or []
+        ]
+        return cls(**fields)
 
 # ---------------------------------------------------------------------------
 # Task 38.5 – Aggregation Helpers
 # ---------------------------------------------------------------------------
 
+def _p95_exclusive(arr: np.ndarray) -> float:
+    """95th percentile as ``statistics.quantiles(data, n=100)[94]`` computes it.
+
+    The exclusive method extrapolates past the sample for small counts, which
+    no ``np.percentile`` method reproduces, so only the two order statistics it
+    interpolates between are selected (``np.partition``, no full sort).
+    """
+    n = len(arr)
+    if n < 2:
+        return float(arr[0])
+    j = min(max(95 * (n + 1) // 100, 1), n - 1)
+    delta = 95 * (n + 1) - j * 100
+    lower, upper = np.partition(arr, (j - 1, j))[j - 1:j + 1]
+    return float((lower * (100 - delta) + upper * delta) / 100)
+
+
 def aggregate_workflow_metrics(workflows: List["WorkflowMetrics"]) -> Dict[str, Dict[str, Any]]:
     """Aggregate a list of ``WorkflowMetrics`` instances into node-level stats.
 
-    Returns a mapping ``node_name → {count, error_count, durations, p95_duration, error_rate}``.
-    """
-    from statistics import mean, quantiles
+    Returns a mapping ``node_name → {count, error_count, durations, p95_duration,
+    avg_duration, error_rate}``. Averages come from running sums.
 
+    Percentiles are exact. Callers pass the monitor's ``recent_workflows``,
+    which is capped at 1000 entries, so the per-node duration lists stay
+    bounded without a streaming sketch.
+    """
     node_stats: Dict[str, Dict[str, Any]] = {}
+    # node_name -> [sum of durations, number of durations]
+    duration_totals: Dict[str, List[float]] = {}
 
     for wf in workflows:
         for node in wf.nodes:
-            stats = node_stats.setdefault(node.node_name, {
-                "durations": [],
-                "error_count": 0,
-                "count": 0,
-            })
+            stats = node_stats.get(node.node_name)
+            if stats is None:
+                stats = node_stats[node.node_name] = {"durations": [], "error_count": 0, "count": 0}
+                duration_totals[node.node_name] = [0.0, 0]
 
             if node.duration is not None:
+                totals = duration_totals[node.node_name]
+                totals[0] += node.duration
+                totals[1] += 1
                 stats["durations"].append(node.duration)
             if node.status != "success":
                 stats["error_count"] += 1
@@ -131,8 +208,10 @@ def aggregate_workflow_metrics(workflows: List["WorkflowMetrics"]) -> Dict[str,
     # Post-process metrics
     for node_name, stats in node_stats.items():
         durations = stats["durations"] or [0]
-        stats["p95_duration"] = quantiles(durations, n=100)[94] if len(durations) > 1 else durations[0]
-        stats["avg_duration"] = mean(durations)
+        arr = np.fromiter(durations, dtype=np.float64, count=len(durations))
+        stats["p95_duration"] = _p95_exclusive(arr)
+        total, n = duration_totals[node_name]
+        stats["avg_duration"] = total / n if n else 0.0
         stats["error_rate"] = stats["error_count"] / stats["count"] if stats["count"] else 0.0
 
     return node_stats 
\ No newline at end of file
@@ -4,15 +4,74 @@ This node routes content fetching to the appropriate processor
 (YouTube or Reddit) based on the source_type in the ContentState.
 """
 
+import os
 import re
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
 
 from langsmith import traceable
 
-from ..state import ContentState, update_state_status, YouTubeMetadata, RedditMetadata
+from ..state import ContentState, YouTubeMetadata, RedditMetadata
 from ...youtube_processor import YouTubeProcessor
-from ...reddit_processor import RedditProcessor
+from ...reddit_processor import RedditPost, RedditProcessor
+
+# Reddit URL patterns: /r/subreddit/comments/post_id/title/ (the /r/ prefix is optional)
+_REDDIT_POST_ID_RE = re.compile(r'/(?:r/[^/]+/)?comments/([a-zA-Z0-9]+)/')
+_SUBREDDIT_RE = re.compile(r'/r/([^/]+)/')
+
+
+def _tracing_enabled() -> bool:
+    """Whether LangSmith tracing is switched on for this process."""
+    flag = os.environ.get("LANGSMITH_TRACING") or os.environ.get("LANGCHAIN_TRACING_V2") or ""
+    return flag.strip().lower() in ("1", "true", "yes")
+
+
+def _maybe_traceable(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """``traceable(name=name)`` when tracing is enabled, otherwise a no-op decorator.
+
+    Evaluated at import time, so untraced runs call the methods directly with no
+    span bookkeeping per invocation.
+    """
+    if _tracing_enabled():
+        return traceable(name=name)
+    return lambda func: func
+
+
+def _failed(error_message: str) -> Dict[str, Any]:
+    """State fields marking the fetch as failed."""
+    return {"status": "failed", "error_message": error_message}
+
+
+def canonical_source_url(source_type: str, url: str) -> str:
+    """Return one canonical URL per piece of content.
+
+    Share links, tracking parameters and ``www``/bare hosts all name the same
+    video or post; collapsing them lets fetch caches recognise repeats.
+    URLs without a video/post ID are returned unchanged.
+
+    Args:
+        source_type: "youtube" or "reddit"
+        url: URL as submitted
+
+    Returns:
+        Canonical URL for the content, or ``url`` if it cannot be identified
+    """
+    if source_type == "youtube":
+        parsed = urlparse(url)
+        video_id = None
+        if parsed.netloc.endswith("youtu.be"):
+            video_id = parsed.path.lstrip("/").split("/")[0] or None
+        elif "youtube.com" in parsed.netloc and parsed.path == "/watch":
+            video_ids = parse_qs(parsed.query).get("v")
+            video_id = video_ids[0] if video_ids else None
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+    elif source_type == "reddit":
+        match = _REDDIT_POST_ID_RE.search(url)
+        if match:
+            return f"https://www.reddit.com/comments/{match.group(1)}/"
+    return url
 
 
 class ContentFetcherNode:
@@ -23,7 +82,7 @@ class ContentFetcherNode:
     It updates the state with fetched content, metadata, and status.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the ContentFetcherNode."""
         self._youtube_processor: Optional[YouTubeProcessor] = None
         self._reddit_processor: Optional[RedditProcessor] = None
@@ -42,7 +101,7 @@ class ContentFetcherNode:
             self._reddit_processor = RedditProcessor()
         return self._reddit_processor
 
-    @traceable(name="content_fetcher")
+    @_maybe_traceable("content_fetcher")
     def __call__(self, state: ContentState) -> ContentState:
         """Process content fetching based on source type.
         
@@ -53,40 +112,32 @@ class ContentFetcherNode:
             Updated ContentState with fetched content or error information
         """
         try:
-            # Update state to indicate processing has started
-            updated_state = update_state_status(
-                state, 
-                status="processing", 
-                current_node="content_fetcher"
-            )
-
             source_type = state["source_type"]
             source_url = state["source_url"]
 
             if source_type == "youtube":
-                return self._process_youtube_content(updated_state, source_url)
+                patch = self._process_youtube_content(state, source_url)
             elif source_type == "reddit":
-                return self._process_reddit_content(updated_state, source_url)
+                patch = self._process_reddit_content(state, source_url)
             else:
                 # Handle invalid source type
-                return update_state_status(
-                    updated_state,
-                    status="failed",
-                    current_node="content_fetcher",
-                    error_message=f"Unsupported source type: {source_type}"
-                )
+                patch = _failed(f"Unsupported source type: {source_type}")
 
         except Exception as e:
             # Catch any unexpected errors
-            return update_state_status(
-                state,
-                status="failed",
-                current_node="content_fetcher",
-                error_message=f"Unexpected error in ContentFetcherNode: {str(e)}"
-            )
+            patch = _failed(f"Unexpected error in ContentFetcherNode: {str(e)}")
+
+        # Apply all updates in a single copy of the state
+        return {
+            **state,
+            "status": "processing",
+            "current_node": "content_fetcher",
+            **patch,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
 
-    @traceable(name="youtube_content_processing")
-    def _process_youtube_content(self, state: ContentState, url: str) -> ContentState:
+    @_maybe_traceable("youtube_content_processing")
+    def _process_youtube_content(self, state: ContentState, url: str) -> Dict[str, Any]:
         """Process YouTube content using YouTubeProcessor.
         
         Args:
@@ -94,17 +145,13 @@ class ContentFetcherNode:
             url: YouTube URL to process
             
         Returns:
-            Updated ContentState with YouTube content and metadata
+            State fields to update with YouTube content and metadata
         """
         try:
             # Extract video ID
             video_id = self.youtube_processor.get_video_id(url)
             if not video_id:
-                return update_state_status(
-                    state,
-                    status="failed",
-                    error_message=f"Could not extract video ID from URL: {url}"
-                )
+                return _failed(f"Could not extract video ID from URL: {url}")
 
             # Get transcript using base model (as specified in tests)
             transcript = self.youtube_processor.get_transcript(url, model_size="base")
@@ -121,32 +168,21 @@ class ContentFetcherNode:
                 "upload_date": None  # Could be enhanced to fetch upload date
             }
 
-            # Update state with fetched content
-            result_state = state.copy()
-            result_state["raw_content"] = transcript
-            result_state["content_id"] = video_id
-            result_state["metadata"] = {**state["metadata"], **youtube_metadata}
-            result_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            return result_state
+            return {
+                "raw_content": transcript,
+                "content_id": video_id,
+                "metadata": {**state["metadata"], **youtube_metadata},
+            }
 
         except ValueError as e:
             # Handle YouTubeProcessor errors
-            return update_state_status(
-                state,
-                status="failed",
-                error_message=str(e)
-            )
+            return _failed(str(e))
         except Exception as e:
             # Handle unexpected errors
-            return update_state_status(
-                state,
-                status="failed",
-                error_message=f"Failed to process YouTube content: {str(e)}"
-            )
+            return _failed(f"Failed to process YouTube content: {str(e)}")
 
-    @traceable(name="reddit_content_processing")
-    def _process_reddit_content(self, state: ContentState, url: str) -> ContentState:
+    @_maybe_traceable("reddit_content_processing")
+    def _process_reddit_content(self, state: ContentState, url: str) -> Dict[str, Any]:
         """Process Reddit content using RedditProcessor.
         
         Args:
@@ -154,44 +190,32 @@ class ContentFetcherNode:
             url: Reddit URL to process
             
         Returns:
-            Updated ContentState with Reddit content and metadata
+            State fields to update with Reddit content and metadata
         """
         try:
             # Extract post ID from URL
             post_id = self._extract_reddit_post_id(url)
+            target_post: Optional[RedditPost]
             
-            # Extract subreddit from URL
-            subreddit = self._extract_subreddit_from_url(url)
-            if not subreddit:
-                return update_state_status(
-                    state,
-                    status="failed",
-                    error_message=f"Could not extract subreddit from URL: {url}"
-                )
-
-            # Fetch the specific post (we get posts from subreddit and find our post)
-            posts = self.reddit_processor.fetch_posts(
-                subreddit_name=subreddit,
-                limit=50,  # Fetch more posts to find the specific one
-                sort_type="new"  # Use 'new' to get recent posts which might include our target
-            )
-
-            # Find the specific post if we have a post_id
-            target_post = None
             if post_id:
-                target_post = next((post for post in posts if post.id == post_id), None)
-            
-            # If we can't find the specific post, use the first post as fallback
-            if not target_post and posts:
-                target_post = posts[0]
-                post_id = target_post.id
+                # Fetch the specific post directly instead of scanning a listing
+                target_post = self.reddit_processor.fetch_post_by_id(post_id)
+                sort_type = "id"
+            else:
+                # No post in the URL: fall back to the newest post of the subreddit
+                subreddit = self._extract_subreddit_from_url(url)
+                if not subreddit:
+                    return _failed(f"Could not extract subreddit from URL: {url}")
+                sort_type = "new"
+                posts = self.reddit_processor.fetch_posts(
+                    subreddit_name=subreddit,
+                    limit=1,
+                    sort_type=sort_type
+                )
+                target_post = posts[0] if posts else None
 
             if not target_post:
-                return update_state_status(
-                    state,
-                    status="failed",
-                    error_message=f"Could not fetch Reddit post from {url}"
-                )
+                return _failed(f"Could not fetch Reddit post from {url}")
 
             # Process the post content
             processed_content = self.reddit_processor.process_post_content(
@@ -213,33 +237,22 @@ class ContentFetcherNode:
                 "is_self": target_post.is_self,
                 "link_flair_text": target_post.link_flair_text,
                 "included_comments": 5,  # Number of comments we included
-                "sort_type": "new",  # How we sorted when fetching
+                "sort_type": sort_type,  # "id" when fetched directly, else the listing sort
                 "time_filter": "all"  # Time filter used
             }
 
-            # Update state with fetched content
-            result_state = state.copy()
-            result_state["raw_content"] = processed_content
-            result_state["content_id"] = target_post.id
-            result_state["metadata"] = {**state["metadata"], **reddit_metadata}
-            result_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            return result_state
+            return {
+                "raw_content": processed_content,
+                "content_id": target_post.id,
+                "metadata": {**state["metadata"], **reddit_metadata},
+            }
 
         except ValueError as e:
             # Handle RedditProcessor errors
-            return update_state_status(
-                state,
-                status="failed",
-                error_message=str(e)
-            )
+            return _failed(str(e))
         except Exception as e:
             # Handle unexpected errors
-            return update_state_status(
-                state,
-                status="failed",
-                error_message=f"Failed to process Reddit content: {str(e)}"
-            )
+            return _failed(f"Failed to process Reddit content: {str(e)}")
 
     def _extract_reddit_post_id(self, url: str) -> Optional[str]:
         """Extract Reddit post ID from URL.
@@ -250,18 +263,8 @@ class ContentFetcherNode:
         Returns:
             Post ID if found, None otherwise
         """
-        # Reddit URL pattern: /r/subreddit/comments/post_id/title/
-        patterns = [
-            r'/r/[^/]+/comments/([a-zA-Z0-9]+)/',
-            r'/comments/([a-zA-Z0-9]+)/'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = _REDDIT_POST_ID_RE.search(url)
+        return match.group(1) if match else None
 
     def _extract_subreddit_from_url(self, url: str) -> Optional[str]:
         """Extract subreddit name from URL.
@@ -272,10 +275,5 @@ class ContentFetcherNode:
         Returns:
             Subreddit name if found, None otherwise
         """
-        # Reddit URL pattern: /r/subreddit/...
-        pattern = r'/r/([^/]+)/'
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-        
-        return None 
\ No newline at end of file
+        match = _SUBREDDIT_RE.search(url)
+        return match.group(1) if match else None 
\ No newline at end of file
@@ -6,12 +6,60 @@ and assigns relevance scores based on multiple criteria including content qualit
 engagement metrics, recency, source credibility, and content length.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
+from bisect import bisect_right
 import math
 import re
+
+import numpy as np
+
 from ..state import ContentState
 
+_UTC = timezone.utc
+
+# Keyword matchers for _score_content_quality, compiled once per process.
+# The lookahead finds every keyword occurrence, including overlapping ones,
+# so a single scan reports the same matches as one ``in`` test per keyword.
+_EDUCATIONAL_KEYWORDS = (
+    "tutorial", "guide", "learn", "explain", "how to", "introduction",
+    "comprehensive", "detailed", "analysis", "review", "comparison"
+)
+_CLICKBAIT_WORDS = ("shocking", "unbelievable", "you won't believe", "amazing trick")
+_EDUCATIONAL_RE = re.compile("(?=(" + "|".join(map(re.escape, _EDUCATIONAL_KEYWORDS)) + "))")
+_CLICKBAIT_RE = re.compile("|".join(map(re.escape, _CLICKBAIT_WORDS)))
+
+# Source credibility indicators for _score_source_credibility
+_CREDIBLE_CHANNEL_INDICATORS = ("tech", "education", "tutorial", "programming")
+_QUALITY_SUBREDDITS = frozenset(("programming", "python", "technology"))
+
+# Length scoring tables: bisect_right(bounds, x) indexes scores. Each optimal
+# range is closed at both ends, so upper bounds are nudged just past the limit.
+_DURATION_BOUNDS = (120, 300, math.nextafter(1800, math.inf), math.nextafter(3600, math.inf))
+_DURATION_SCORES = (0.3, 0.7, 1.0, 0.7, 0.5)  # seconds: <2m, 2-5m, 5-30m, 30-60m, >1h
+_TEXT_LENGTH_BOUNDS = (200, 500, math.nextafter(3000, math.inf), math.nextafter(8000, math.inf))
+_TEXT_LENGTH_SCORES = (0.3, 0.7, 1.0, 0.7, 0.5)  # characters: <200, 200-500, 500-3000, 3000-8000, >8000
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, with a fast path for ``YYYY-MM-DDTHH:MM:SSZ``.
+
+    The canonical UTC shape is sliced directly; anything else goes through
+    ``datetime.fromisoformat``. Raises ValueError for unparseable input.
+    """
+    if (
+        len(value) == 20 and value[19] == 'Z' and value[4] == '-' and value[7] == '-'
+        and value[10] == 'T' and value[13] == ':' and value[16] == ':'
+    ):
+        return datetime(
+            int(value[:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=_UTC,
+        )
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
 
 class ContentScorer:
     """
@@ -40,6 +88,33 @@ class ContentScorer:
             "source_credibility": 0.2,
             "content_length": 0.15
         }
+        
+        # Weights in the order __call__ combines the component scores; criteria
+        # missing from custom weights contribute nothing
+        self._weight_vec = tuple(
+            self.weights.get(name, 0.0)
+            for name in (
+                "content_quality",
+                "engagement_metrics",
+                "recency",
+                "source_credibility",
+                "content_length",
+            )
+        )
+        # Components with a zero weight cannot affect the score, so they are
+        # never evaluated (e.g. no date parsing when recency is switched off)
+        component_scorers = (
+            self._score_content_quality,
+            self._score_engagement_metrics,
+            self._score_recency,
+            self._score_source_credibility,
+            self._score_content_length,
+        )
+        self._active_scorers = tuple(
+            (scorer, weight)
+            for scorer, weight in zip(component_scorers, self._weight_vec)
+            if weight != 0
+        )
     
     def __call__(self, state: ContentState) -> ContentState:
         """
@@ -51,21 +126,8 @@ class ContentScorer:
         Returns:
             ContentState with added relevance_score field
         """
-        # Calculate individual scoring components
-        quality_score = self._score_content_quality(state)
-        engagement_score = self._score_engagement_metrics(state)
-        recency_score = self._score_recency(state)
-        credibility_score = self._score_source_credibility(state)
-        length_score = self._score_content_length(state)
-        
-        # Calculate weighted final score
-        relevance_score = (
-            quality_score * self.weights["content_quality"] +
-            engagement_score * self.weights["engagement_metrics"] +
-            recency_score * self.weights["recency"] +
-            credibility_score * self.weights["source_credibility"] +
-            length_score * self.weights["content_length"]
-        )
+        # Calculate weighted final score from the non-zero-weight components
+        relevance_score = sum(scorer(state) * weight for scorer, weight in self._active_scorers)
         
         # Ensure score is normalized to 0-1 range
         relevance_score = max(0.0, min(1.0, relevance_score))
@@ -75,6 +137,81 @@ class ContentScorer:
             "relevance_score": relevance_score
         }
     
+    def score_batch(self, states: List[ContentState]) -> np.ndarray:
+        """
+        Score many items at once.
+        
+        Engagement, recency and length are computed column-wise with NumPy over
+        the whole batch; quality and credibility stay per item since they are
+        string checks. Scores match calling the scorer on each item in turn.
+        
+        Args:
+            states: ContentStates to score
+            
+        Returns:
+            Array of relevance scores between 0.0 and 1.0, one per state
+        """
+        count = len(states)
+        if count == 0:
+            return np.empty(0)
+        
+        weights = self._weight_vec
+        now = datetime.now(timezone.utc)
+        metadatas = [state.get("metadata", {}) for state in states]
+        source_types = np.array([state.get("source_type", "") for state in states])
+        youtube = source_types == "youtube"
+        reddit = source_types == "reddit"
+        
+        def column(key: str) -> np.ndarray:
+            return np.array([metadata.get(key, 0) for metadata in metadatas], dtype=np.float64)
+        
+        # Columns of zero-weight components stay at zero and are not computed
+        scores = np.zeros((count, 5))
+        if weights[0]:
+            scores[:, 0] = [self._score_content_quality(state) for state in states]
+        if weights[3]:
+            scores[:, 3] = [self._score_source_credibility(state) for state in states]
+        
+        # Engagement: log-scaled counts per platform, neutral elsewhere
+        if weights[1]:
+            engagement = np.full(count, 0.5)
+            if youtube.any():
+                views = np.minimum(1.0, np.log10(np.maximum(column("view_count")[youtube], 1)) / 6)
+                likes = np.minimum(1.0, np.log10(np.maximum(column("like_count")[youtube], 1)) / 4)
+                engagement[youtube] = (views + likes) / 2
+            if reddit.any():
+                upvotes = np.minimum(1.0, np.log10(np.maximum(column("score")[reddit], 1)) / 3)
+                comments = np.minimum(1.0, np.log10(np.maximum(column("num_comments")[reddit], 1)) / 2)
+                engagement[reddit] = (upvotes + comments) / 2
+            scores[:, 1] = engagement
+        
+        # Recency: exponential decay, neutral where the date is missing or invalid
+        if weights[2]:
+            days_old = np.array(
+                [self._days_since_publication(state, now) for state in states], dtype=np.float64
+            )
+            recency = np.minimum(1.0, np.exp(-days_old / 30.0))
+            scores[:, 2] = np.where(np.isnan(days_old), 0.5, recency)
+        
+        # Length: duration buckets for YouTube, character-count buckets otherwise
+        if weights[4]:
+            durations = column("duration")
+            content_lengths = np.array(
+                [len(state.get("raw_content") or "") for state in states], dtype=np.float64
+            )
+            youtube_length = np.where(
+                durations == 0,
+                0.5,
+                np.take(_DURATION_SCORES, np.searchsorted(_DURATION_BOUNDS, durations, side="right")),
+            )
+            text_length = np.take(
+                _TEXT_LENGTH_SCORES, np.searchsorted(_TEXT_LENGTH_BOUNDS, content_lengths, side="right")
+            )
+            scores[:, 4] = np.where(youtube, youtube_length, text_length)
+        
+        clipped: np.ndarray = np.clip(scores @ np.array(weights), 0.0, 1.0)
+        return clipped
+    
     def _score_content_quality(self, state: ContentState) -> float:
         """
         Score content quality based on summary analysis and structure.
@@ -99,22 +236,21 @@ class ContentScorer:
         elif summary_length > 20:
             quality_indicators += 0.2
         
-        # Look for educational/informative keywords
-        educational_keywords = [
-            "tutorial", "guide", "learn", "explain", "how to", "introduction",
-            "comprehensive", "detailed", "analysis", "review", "comparison"
-        ]
+        # Look for educational/informative keywords; two distinct hits reach the cap
         summary_lower = summary.lower()
-        keyword_matches = sum(1 for keyword in educational_keywords if keyword in summary_lower)
-        quality_indicators += min(0.4, keyword_matches * 0.2)
+        matched_keywords = set()
+        for match in _EDUCATIONAL_RE.finditer(summary_lower):
+            matched_keywords.add(match.group(1))
+            if len(matched_keywords) >= 2:
+                break
+        quality_indicators += min(0.4, len(matched_keywords) * 0.2)
         
         # Sentence structure (proper punctuation, capitalization)
         if summary[0].isupper() and ('.' in summary or '!' in summary or '?' in summary):
             quality_indicators += 0.2
         
         # Avoid clickbait indicators
-        clickbait_words = ["shocking", "unbelievable", "you won't believe", "amazing trick"]
-        if not any(word in summary_lower for word in clickbait_words):
+        if _CLICKBAIT_RE.search(summary_lower) is None:
             quality_indicators += 0.1
         
         return min(1.0, quality_indicators)
@@ -161,16 +297,30 @@ class ContentScorer:
         
         return (upvote_score + comment_score) / 2
     
-    def _score_recency(self, state: ContentState) -> float:
+    def _score_recency(self, state: ContentState, now: Optional[datetime] = None) -> float:
         """
         Score content recency with exponential decay for older content.
         
         Args:
             state: ContentState containing metadata with publication date
+            now: Reference time (UTC); taken once by the caller so a batch of
+                 items shares it. Defaults to the current time.
             
         Returns:
             Recency score between 0.0 and 1.0
         """
+        days_old = self._days_since_publication(state, now or datetime.now(timezone.utc))
+        if days_old is None:
+            return 0.5  # Default neutral score if no usable date
+        
+        # Exponential decay: score = e^(-days/30)
+        # This gives ~37% score after 30 days, ~14% after 60 days
+        recency_score = math.exp(-days_old / 30.0)
+        
+        return min(1.0, recency_score)
+    
+    def _days_since_publication(self, state: ContentState, now: datetime) -> Optional[int]:
+        """Whole days between the content's publication date and ``now``, if known."""
         metadata = state.get("metadata", {})
         
         # Try to get publication date from various possible fields
@@ -181,33 +331,23 @@ class ContentScorer:
         )
         
         if not pub_date_str:
-            return 0.5  # Default neutral score if no date available
+            return None
+        if isinstance(pub_date_str, (int, float)) and not isinstance(pub_date_str, bool):
+            # Epoch seconds, as Reddit's created_utc: integer day arithmetic, no parsing
+            return int((now.timestamp() - pub_date_str) // 86400)
+        if not isinstance(pub_date_str, str):
+            return None
         
         try:
-            # Parse the date string
-            if isinstance(pub_date_str, str):
-                if pub_date_str.endswith('Z'):
-                    pub_date = datetime.fromisoformat(pub_date_str.replace('Z', '+00:00'))
-                else:
-                    pub_date = datetime.fromisoformat(pub_date_str)
-            else:
-                return 0.5
+            pub_date = _parse_iso_datetime(pub_date_str)
             
-            # Calculate days since publication
-            now = datetime.now(timezone.utc)
             if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
-            
-            days_old = (now - pub_date).days
+                pub_date = pub_date.replace(tzinfo=_UTC)
             
-            # Exponential decay: score = e^(-days/30)
-            # This gives ~37% score after 30 days, ~14% after 60 days
-            recency_score = math.exp(-days_old / 30.0)
-            
-            return min(1.0, recency_score)
+            return (now - pub_date).days
             
         except (ValueError, TypeError):
-            return 0.5  # Default if date parsing fails
+            return None  # Date parsing failed
     
     def _score_source_credibility(self, state: ContentState) -> float:
         """
@@ -224,10 +364,9 @@ class ContentScorer:
         
         if source_type == "youtube":
             channel_name = metadata.get("channel_name", "").lower()
-            credible_indicators = ["tech", "education", "tutorial", "programming"]
             
             credibility_score = 0.5
-            for indicator in credible_indicators:
+            for indicator in _CREDIBLE_CHANNEL_INDICATORS:
                 if indicator in channel_name:
                     credibility_score += 0.1
             
@@ -235,9 +374,8 @@ class ContentScorer:
             
         elif source_type == "reddit":
             subreddit = metadata.get("subreddit", "").lower()
-            quality_subreddits = ["programming", "python", "technology"]
             
-            if subreddit in quality_subreddits:
+            if subreddit in _QUALITY_SUBREDDITS:
                 return 0.8
             elif subreddit:
                 return 0.6
@@ -266,25 +404,11 @@ class ContentScorer:
                 return 0.5
             
             # Optimal range: 5-30 minutes (300-1800 seconds)
-            if 300 <= duration <= 1800:
-                return 1.0
-            elif duration < 120:  # Too short (< 2 minutes)
-                return 0.3
-            elif duration > 3600:  # Too long (> 1 hour)
-                return 0.5
-            else:
-                return 0.7
+            return _DURATION_SCORES[bisect_right(_DURATION_BOUNDS, duration)]
         
         else:
             # For text content, use character count
             content_length = len(raw_content) if raw_content else 0
             
             # Optimal range: 500-3000 characters
-            if 500 <= content_length <= 3000:
-                return 1.0
-            elif content_length < 200:  # Too short
-                return 0.3
-            elif content_length > 8000:  # Too long
-                return 0.5
-            else:
-                return 0.7 
\ No newline at end of file
+            return _TEXT_LENGTH_SCORES[bisect_right(_TEXT_LENGTH_BOUNDS, content_length)]
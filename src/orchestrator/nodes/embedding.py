@@ -5,14 +5,116 @@ vector embeddings for content. Since DeepSeek doesn't offer embedding models,
 we use OpenAI which provides reliable embeddings at reasonable cost.
 """
 
+import asyncio
+import hashlib
+import logging
 import os
-from typing import Optional, List
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, List, Tuple, cast
 from datetime import datetime, timezone
 
+import numpy as np
+import tiktoken
 from langchain_openai import OpenAIEmbeddings
 from langsmith import traceable
 
 from ..state import ContentState, update_state_status
+from src import config as app_config
+
+logger = logging.getLogger(__name__)
+
+# Output dimension of each supported OpenAI embedding model
+_MODEL_DIMENSIONS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072
+}
+
+
+class EmbeddingCache:
+    """Persistent content-addressed cache of embedding vectors.
+    
+    Vectors are stored in a SQLite table keyed by a BLAKE2b hash of the model
+    name and the exact text sent for embedding, so identical summaries are
+    embedded once across runs. Entries never expire (the same text always
+    yields the same vector); beyond ``max_items`` the least recently used
+    ones are pruned.
+    """
+
+    def __init__(self, path: str, max_items: Optional[int] = None):
+        """Open (creating if needed) the cache database at ``path``.
+        
+        Args:
+            path: SQLite database file
+            max_items: Maximum number of vectors to keep; if None the value
+                       from ``IH_EMBEDDING_CACHE_MAX_ITEMS`` is used
+        """
+        self.path = path
+        self.max_items = max_items or app_config.IH_EMBEDDING_CACHE_MAX_ITEMS
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Shared by the orchestrator's worker threads; access is serialized by _lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+
+    @staticmethod
+    def key(model: str, content: str) -> str:
+        """Cache key for ``content`` embedded with ``model``."""
+        return hashlib.blake2b(f"{model}\0{content}".encode("utf-8"), digest_size=20).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached vectors for whichever of ``keys`` are present."""
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._lock, self._conn:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", keys
+                ).fetchall()
+                if rows:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key, _ in rows],
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache retrieval failed: {e}")
+            return {}
+        return {key: np.frombuffer(vector, dtype=np.float64).tolist() for key, vector in rows}
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors by key, pruning the least recently used beyond ``max_items``."""
+        if not items:
+            return
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    [
+                        (key, np.asarray(vector, dtype=np.float64).tobytes(), now)
+                        for key, vector in items.items()
+                    ],
+                )
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key NOT IN "
+                    "(SELECT key FROM embeddings ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_items,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache storage failed: {e}")
 
 
 class EmbeddingNode:
@@ -26,7 +128,8 @@ class EmbeddingNode:
         self,
         model: str = "text-embedding-ada-002",
         api_key: Optional[str] = None,
-        max_tokens: int = 8191  # Max tokens for ada-002
+        max_tokens: int = 8191,  # Max tokens for ada-002
+        cache_path: Optional[str] = None
     ):
         """Initialize the EmbeddingNode.
         
@@ -34,25 +137,47 @@ class EmbeddingNode:
             model: OpenAI embedding model to use
             api_key: OpenAI API key (uses OPENAI_API_KEY env var if None)
             max_tokens: Maximum tokens to process (truncate if needed)
+            cache_path: SQLite file for the persistent embedding cache (uses
+                        IH_EMBEDDING_CACHE_PATH if None; caching is off when
+                        neither is set)
         """
         self.model = model
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.max_tokens = max_tokens
         
         # Store initialization parameters for lazy loading
-        self._embeddings_kwargs = {
+        self._embeddings_kwargs: Dict[str, Any] = {
             "model": self.model,
             "api_key": self.api_key
         }
-        self._embeddings = None
+        self._embeddings: Optional[OpenAIEmbeddings] = None
+        # Tokenizer for exact truncation; None until first needed or if unavailable
+        self._encoding: Optional[tiktoken.Encoding] = None
+        self._encoding_unavailable = False
+        cache_path = cache_path or app_config.IH_EMBEDDING_CACHE_PATH
+        self._cache = EmbeddingCache(cache_path) if cache_path else None
 
     @property
-    def embeddings(self):
+    def embeddings(self) -> OpenAIEmbeddings:
         """Lazy-load the embeddings to avoid API key validation during initialization."""
         if self._embeddings is None:
             self._embeddings = OpenAIEmbeddings(**self._embeddings_kwargs)
         return self._embeddings
 
+    def _get_encoding(self) -> Optional[tiktoken.Encoding]:
+        """Lazy-load the model's tokenizer, or return None if it cannot be loaded.
+
+        tiktoken downloads its BPE ranks on first use, so offline environments
+        fall back to the character-based estimate instead of failing.
+        """
+        if self._encoding is None and not self._encoding_unavailable:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except Exception as e:
+                logger.warning(f"Tokenizer for {self.model} unavailable, estimating tokens: {e}")
+                self._encoding_unavailable = True
+        return self._encoding
+
     @traceable(name="embedding_generator")
     def __call__(self, state: ContentState) -> ContentState:
         """Generate embeddings for the content in state.
@@ -65,39 +190,222 @@ class EmbeddingNode:
         """
         try:
             # Get content to embed (prefer summary over raw content)
-            content = state.get("summary") or state.get("raw_content", "")
+            content = self._content_to_embed(state)
             
-            if not content or not content.strip():
-                return update_state_status(
-                    state,
-                    status="error",
-                    current_node="embedding",
-                    error_message="No content available for embedding (content is empty or missing)"
+            if content is None:
+                return self._error_state(
+                    state, "No content available for embedding (content is empty or missing)"
                 )
             
-            # Truncate content if it's too long
-            truncated_content = self._truncate_content(content)
+            cached = self._cache.get_many([self._cache.key(self.model, content)]) if self._cache else {}
+            if cached:
+                return self._embedded_state(state, next(iter(cached.values())))
             
             # Generate embeddings using OpenAI
-            embedding_vector = self.embeddings.embed_query(truncated_content)
+            embedding_vector = self.embeddings.embed_query(content)
+            if self._cache:
+                self._cache.set_many({self._cache.key(self.model, content): embedding_vector})
+            
+            return self._embedded_state(state, embedding_vector)
+            
+        except Exception as e:
+            return self._error_state(state, f"Embedding generation failed: {str(e)}")
+
+    @traceable(name="embedding_generator")
+    async def acall(self, state: ContentState) -> ContentState:
+        """Async variant of :meth:`__call__` using ``aembed_query``.
+        
+        Args:
+            state: ContentState containing summary or raw_content
+            
+        Returns:
+            Updated ContentState with embeddings and updated status
+        """
+        try:
+            content = self._content_to_embed(state)
+            
+            if content is None:
+                return self._error_state(
+                    state, "No content available for embedding (content is empty or missing)"
+                )
             
-            # Update state with embeddings
-            updated_state = state.copy()
-            updated_state["embeddings"] = embedding_vector
-            updated_state["status"] = "embedded"
-            updated_state["current_node"] = "embedding"
-            updated_state["updated_at"] = datetime.now(timezone.utc).isoformat()
+            cached = self._cache.get_many([self._cache.key(self.model, content)]) if self._cache else {}
+            if cached:
+                return self._embedded_state(state, next(iter(cached.values())))
             
-            return updated_state
+            embedding_vector = await self.embeddings.aembed_query(content)
+            if self._cache:
+                self._cache.set_many({self._cache.key(self.model, content): embedding_vector})
+            
+            return self._embedded_state(state, embedding_vector)
             
         except Exception as e:
-            return update_state_status(
-                state,
-                status="error",
-                current_node="embedding",
-                error_message=f"Embedding generation failed: {str(e)}"
+            return self._error_state(state, f"Embedding generation failed: {str(e)}")
+
+    @traceable(name="batch_embedding_generator")
+    def embed_batch(self, states: List[ContentState], batch_size: int = 96) -> List[ContentState]:
+        """Generate embeddings for many states with one API request per chunk.
+        
+        Each chunk of up to ``batch_size`` embeddable states is sent as a single
+        ``embed_documents`` call instead of one ``embed_query`` round-trip per
+        item; texts already in the embedding cache are not sent at all.
+        Results match calling the node on each state: items without content
+        get an error state, and a failed request marks every item of its
+        chunk as failed.
+        
+        Args:
+            states: ContentStates containing summary or raw_content
+            batch_size: Maximum number of texts per embeddings request
+            
+        Returns:
+            Updated ContentStates, in the same order as ``states``
+        """
+        results, pending = self._prepare_batch(states)
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            try:
+                vectors = self.embeddings.embed_documents([content for _, content in chunk])
+            except Exception as e:
+                self._fail_chunk(states, results, chunk, e)
+            else:
+                self._apply_chunk(states, results, chunk, vectors)
+        
+        # Every index is filled once all chunks are applied
+        return cast(List[ContentState], results)
+
+    async def aembed_batch(
+        self,
+        states: List[ContentState],
+        batch_size: int = 96,
+        max_concurrency: int = 4
+    ) -> List[ContentState]:
+        """Async variant of :meth:`embed_batch` with concurrent requests.
+        
+        Chunks are sent through ``aembed_documents`` with up to
+        ``max_concurrency`` requests in flight, so wall time for many chunks
+        approaches one round-trip per ``max_concurrency`` chunks instead of one
+        per chunk. Keep ``max_concurrency`` within the account's rate limits.
+        
+        Args:
+            states: ContentStates containing summary or raw_content
+            batch_size: Maximum number of texts per embeddings request
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Updated ContentStates, in the same order as ``states``
+        """
+        results, pending = self._prepare_batch(states)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def embed_chunk(chunk: List[Tuple[int, str]]) -> None:
+            async with semaphore:
+                try:
+                    vectors = await self.embeddings.aembed_documents([content for _, content in chunk])
+                except Exception as e:
+                    self._fail_chunk(states, results, chunk, e)
+                else:
+                    self._apply_chunk(states, results, chunk, vectors)
+        
+        await asyncio.gather(*(
+            embed_chunk(pending[start:start + batch_size])
+            for start in range(0, len(pending), batch_size)
+        ))
+        return cast(List[ContentState], results)
+
+    def _prepare_batch(
+        self, states: List[ContentState]
+    ) -> Tuple[List[Optional[ContentState]], List[Tuple[int, str]]]:
+        """Resolve what a batch can without the API.
+        
+        Returns:
+            Per-state results (error states for empty content and embedded
+            states for cache hits, None elsewhere) and the ``(index, content)``
+            pairs that still need embedding
+        """
+        results: List[Optional[ContentState]] = [None] * len(states)
+        pending = []  # (index, truncated content) of embeddable states
+        
+        for index, state in enumerate(states):
+            content = self._content_to_embed(state)
+            if content is None:
+                results[index] = self._error_state(
+                    state, "No content available for embedding (content is empty or missing)"
+                )
+            else:
+                pending.append((index, content))
+        
+        if self._cache and pending:
+            # Serve cache hits locally and only send the misses to OpenAI
+            keys = {index: self._cache.key(self.model, content) for index, content in pending}
+            cached = self._cache.get_many(list(set(keys.values())))
+            misses = []
+            for index, content in pending:
+                vector = cached.get(keys[index])
+                if vector is None:
+                    misses.append((index, content))
+                else:
+                    results[index] = self._embedded_state(states[index], vector)
+            pending = misses
+        
+        return results, pending
+
+    def _apply_chunk(
+        self,
+        states: List[ContentState],
+        results: List[Optional[ContentState]],
+        chunk: List[Tuple[int, str]],
+        vectors: List[List[float]],
+    ) -> None:
+        """Record the vectors returned for ``chunk`` and store them in the cache."""
+        for (index, _), vector in zip(chunk, vectors):
+            results[index] = self._embedded_state(states[index], vector)
+        if self._cache:
+            self._cache.set_many({
+                self._cache.key(self.model, content): vector
+                for (_, content), vector in zip(chunk, vectors)
+            })
+
+    def _fail_chunk(
+        self,
+        states: List[ContentState],
+        results: List[Optional[ContentState]],
+        chunk: List[Tuple[int, str]],
+        error: Exception,
+    ) -> None:
+        """Mark every state of a failed request as errored."""
+        for index, _ in chunk:
+            results[index] = self._error_state(
+                states[index], f"Embedding generation failed: {str(error)}"
             )
 
+    def _content_to_embed(self, state: ContentState) -> Optional[str]:
+        """Truncated text to embed for ``state``, or None if it has no content."""
+        content = state.get("summary") or state.get("raw_content", "")
+        if not content or not content.strip():
+            return None
+        # Truncate content if it's too long
+        return self._truncate_content(content)
+
+    def _embedded_state(self, state: ContentState, embedding_vector: List[float]) -> ContentState:
+        """Copy of ``state`` carrying its embedding vector."""
+        return cast(ContentState, {
+            **state,
+            "embeddings": embedding_vector,
+            "status": "embedded",
+            "current_node": "embedding",
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    def _error_state(self, state: ContentState, error_message: str) -> ContentState:
+        """Copy of ``state`` marked as failed in the embedding node."""
+        return update_state_status(
+            state,
+            status="error",
+            current_node="embedding",
+            error_message=error_message
+        )
+
     def _truncate_content(self, content: str) -> str:
         """Truncate content to stay within token limits.
         
@@ -107,19 +415,26 @@ class EmbeddingNode:
         Returns:
             Truncated content if necessary
         """
-        # Rough estimate: 4 characters per token for English text
-        estimated_tokens = len(content) // 4
-        
-        if estimated_tokens <= self.max_tokens:
+        # A token covers at least one UTF-8 byte, so short text needs no counting
+        if len(content) * 4 <= self.max_tokens:
             return content
         
-        # Truncate to approximate token limit
-        max_chars = self.max_tokens * 4
-        truncated = content[:max_chars]
+        encoding = self._get_encoding()
+        if encoding is not None:
+            # Summaries may contain special-token text; treat it as plain text
+            token_ids = encoding.encode(content, disallowed_special=())
+            if len(token_ids) <= self.max_tokens:
+                return content
+            truncated = encoding.decode(token_ids[:self.max_tokens])
+        else:
+            # Rough estimate: 4 characters per token for English text
+            if len(content) // 4 <= self.max_tokens:
+                return content
+            truncated = content[:self.max_tokens * 4]
         
         # Try to truncate at a sentence boundary
         last_period = truncated.rfind('.')
-        if last_period > max_chars * 0.8:  # Only if we don't lose too much content
+        if last_period > len(truncated) * 0.8:  # Only if we don't lose too much content
             truncated = truncated[:last_period + 1]
         
         return truncated
@@ -130,9 +445,4 @@ class EmbeddingNode:
         Returns:
             Embedding dimension (1536 for ada-002)
         """
-        model_dimensions = {
-            "text-embedding-ada-002": 1536,
-            "text-embedding-3-small": 1536,
-            "text-embedding-3-large": 3072
-        }
-        return model_dimensions.get(self.model, 1536) 
\ No newline at end of file
+        return _MODEL_DIMENSIONS.get(self.model, 1536) 
\ No newline at end of file
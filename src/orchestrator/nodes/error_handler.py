@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime, timezone
 from typing import Any
 
 class ErrorHandlerNode:
@@ -15,8 +16,9 @@ class ErrorHandlerNode:
 
     def __init__(self, retry_manager: "RetryManager | None" = None) -> None:  # type: ignore[name-defined]
         # Local import to avoid a heavy import graph for callers that only need the
-        # error handler.
-        from src.orchestrator.main import OrchestratorConfig, RetryManager  # pylint: disable=import-inside-function,cyclic-import
+        # error handler (and the main -> graph -> error_handler import cycle).
+        # Everything __call__ needs from main is bound here, once per node.
+        from src.orchestrator.main import ErrorClassifier, OrchestratorConfig, RetryManager  # pylint: disable=import-inside-function,cyclic-import
 
         # If no retry manager is supplied we create a default one based on the
         # global orchestrator configuration.  This keeps behaviour consistent
@@ -24,11 +26,12 @@ class ErrorHandlerNode:
         # configured independently for testing.
         self.retry_manager = retry_manager or RetryManager(OrchestratorConfig().retry_config)
         self._logger = logging.getLogger(__name__)
+        self._classify_error = ErrorClassifier.classify_error
 
     # NOTE: `state` is intentionally typed as *Any* to avoid a hard dependency on
     # the full ContentState TypedDict at import time.  At runtime the node
-    # expects a mutable mapping that supports `.copy()` – this matches both
-    # TypedDicts **and** simple dicts used in tests.
+    # expects a mapping that can be unpacked into a new dict – this matches
+    # both TypedDicts **and** simple dicts used in tests.
     def __call__(self, state: "dict[str, Any]", error: Exception | None = None) -> "dict[str, Any]":
         """Handle an exception and return an updated *failed* state.
 
@@ -49,21 +52,11 @@ class ErrorHandlerNode:
         if error is None:
             return state
 
-        from datetime import datetime, timezone  # Local import saves ~7 ms on cold start
-        from src.orchestrator.main import ErrorClassifier  # pylint: disable=import-inside-function,cyclic-import
-
-        # Copy the incoming state to guarantee immutability.
-        updated_state = state.copy()
-
         # Classify the exception to determine severity / retry logic.
-        error_type = ErrorClassifier.classify_error(error)
-        updated_state["status"] = "failed"
-        updated_state["error_message"] = str(error)
-        updated_state["error_type"] = error_type.value
-        updated_state["processed_at"] = datetime.now(timezone.utc).isoformat()
+        error_type = self._classify_error(error)
 
         # Increment retry count if it exists; initialise otherwise.
-        updated_state["retry_count"] = int(updated_state.get("retry_count", 0)) + 1
+        retry_count = int(state.get("retry_count", 0)) + 1
 
         # Log in structured form so that external observability tools like
         # LangSmith can parse it easily.
@@ -71,15 +64,22 @@ class ErrorHandlerNode:
             "ErrorHandlerNode captured error | type=%s | message=%s | retries=%s",
             error_type.value,
             error,
-            updated_state["retry_count"],
+            retry_count,
         )
 
-        # Decide whether the orchestrator *should* attempt another retry.  We do
-        # **not** raise here because retry orchestration is handled at a higher
-        # level (see Orchestrator._process_content_with_retry).  Instead we
-        # attach a hint that upstream logic can inspect.
-        updated_state["should_retry"] = self.retry_manager.should_retry(
-            error, updated_state["retry_count"] - 1
-        )
+        # Build a new state in one step to guarantee immutability of the input.
+        # ``should_retry`` tells upstream logic whether the orchestrator *should*
+        # attempt another retry.  We do **not** raise here because retry
+        # orchestration is handled at a higher level (see
+        # Orchestrator._process_content_with_retry).
+        updated_state = {
+            **state,
+            "status": "failed",
+            "error_message": str(error),
+            "error_type": error_type.value,
+            "processed_at": datetime.now(timezone.utc).isoformat(),
+            "retry_count": retry_count,
+            "should_retry": self.retry_manager.should_retry(error, retry_count - 1),
+        }
 
         return updated_state
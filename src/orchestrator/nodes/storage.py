@@ -4,15 +4,46 @@ This module provides the StorageNode class for the LangGraph orchestrator,
 handling database persistence operations for processed content.
 """
 
-import json
+import base64
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
+import numpy as np
 from langsmith import traceable
 
 from src.reddit_weekly_top.supabase_client import supabase_client
 from src.orchestrator.state import ContentState
 
+# YouTube and Reddit ids share the table, so a row is identified by both
+# columns; needs the unique index from docs/backend/SUPABASE_PGVECTOR.md
+CONTENT_CONFLICT_TARGET = "source_type,content_id"
+
+
+def quantize_embedding(embedding: List[float]) -> Dict[str, Any]:
+    """Quantize an embedding to int8 with a symmetric per-vector scale.
+    
+    Args:
+        embedding: Float embedding vector.
+        
+    Returns:
+        Dict with the float ``scale`` and the base64-encoded int8 values ``q``,
+        a quarter of the float32 size.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.abs(vector).max()) if vector.size else 0.0
+    if scale == 0.0:
+        quantized = np.zeros(vector.shape, dtype=np.int8)
+    else:
+        quantized = np.round(vector / scale * 127).astype(np.int8)
+    return {"scale": scale, "q": base64.b64encode(quantized.tobytes()).decode("ascii")}
+
+
+def dequantize_embedding(row: Dict[str, Any]) -> np.ndarray:
+    """Recover an approximate float32 embedding from :func:`quantize_embedding` output."""
+    quantized = np.frombuffer(base64.b64decode(row["q"]), dtype=np.int8)
+    embedding: np.ndarray = quantized.astype(np.float32) * (row["scale"] / 127)
+    return embedding
+
 
 class StorageNode:
     """Node for persisting processed content to Supabase database.
@@ -21,11 +52,16 @@ class StorageNode:
     through the orchestration pipeline, including summaries and embeddings.
     """
     
-    def __init__(self):
+    def __init__(self, quantize_embeddings: bool = False):
         """Initialize the StorageNode with Supabase client.
         
         Uses lazy loading pattern to avoid connection during testing.
         
+        Args:
+            quantize_embeddings: Also write an int8-quantized copy of each
+                embedding to the ``embeddings_int8`` column. Only enable
+                this once the table has that (JSONB) column.
+        
         Raises:
             ValueError: If Supabase client is not available.
         """
@@ -34,6 +70,7 @@ class StorageNode:
             raise ValueError("Supabase client not available. Check SUPABASE_URL and SUPABASE_ANON_KEY environment variables.")
         
         self.table_name = "content"
+        self.quantize_embeddings = quantize_embeddings
     
     @traceable(name="content_storage")
     def store_content(self, state: ContentState) -> Dict[str, Any]:
@@ -51,10 +88,13 @@ class StorageNode:
         """
         try:
             # Prepare content for database storage
-            content_data = self._prepare_content_for_storage(state)
+            now_iso = datetime.now(timezone.utc).isoformat()
+            content_data = self._prepare_content_for_storage(state, now_iso)
             
-            # Insert into database
-            response = self.client.table(self.table_name).insert(content_data).execute()
+            # Upsert so a retried store updates the row instead of duplicating it
+            response = self.client.table(self.table_name).upsert(
+                content_data, on_conflict=CONTENT_CONFLICT_TARGET
+            ).execute()
             
             if response.error:
                 raise Exception(f"Failed to store content: {response.error}")
@@ -63,7 +103,7 @@ class StorageNode:
             return {
                 "status": "completed",
                 "content_id": state["content_id"],
-                "stored_at": datetime.now(timezone.utc).isoformat(),
+                "stored_at": now_iso,
                 "database_id": response.data[0].get("id") if response.data else None
             }
             
@@ -138,17 +178,26 @@ class StorageNode:
     def batch_store(self, content_states: List[ContentState]) -> List[Dict[str, Any]]:
         """Store multiple content items in a batch operation.
         
+        Rows are upserted on ``(source_type, content_id)``, like
+        :meth:`store_content`, so re-running a batch updates existing rows
+        instead of failing or duplicating them.
+        
         Args:
             content_states: List of ContentState objects to store.
             
         Returns:
             List of storage results for each content item.
         """
-        # Prepare all content for storage
-        content_data_list = [self._prepare_content_for_storage(state) for state in content_states]
+        # Prepare all content for storage, sharing one timestamp across the batch
+        now_iso = datetime.now(timezone.utc).isoformat()
+        content_data_list = [
+            self._prepare_content_for_storage(state, now_iso) for state in content_states
+        ]
         
-        # Batch insert
-        response = self.client.table(self.table_name).insert(content_data_list).execute()
+        # Batch upsert
+        response = self.client.table(self.table_name).upsert(
+            content_data_list, on_conflict=CONTENT_CONFLICT_TARGET
+        ).execute()
         
         if response.error:
             raise Exception(f"Failed to batch store content: {response.error}")
@@ -159,25 +208,26 @@ class StorageNode:
             results.append({
                 "status": "completed",
                 "content_id": state["content_id"],
-                "stored_at": datetime.now(timezone.utc).isoformat(),
+                "stored_at": now_iso,
                 "database_id": response.data[i].get("id") if response.data and i < len(response.data) else None
             })
         
         return results
     
-    def _prepare_content_for_storage(self, state: ContentState) -> Dict[str, Any]:
+    def _prepare_content_for_storage(self, state: ContentState, now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Prepare ContentState for database storage.
         
         Args:
             state: ContentState to prepare.
+            now_iso: Timestamp for defaulted time fields; batches pass one
+                shared value. Defaults to the current time.
             
         Returns:
             Dict ready for database insertion.
         """
-        # Convert metadata dict to JSON string
-        metadata_json = json.dumps(state.get("metadata", {}))
+        now_iso = now_iso or datetime.now(timezone.utc).isoformat()
         
-        return {
+        content_data = {
             "source_type": state["source_type"],
             "source_url": state["source_url"], 
             "content_id": state["content_id"],
@@ -187,10 +237,18 @@ class StorageNode:
             "embeddings": state.get("embeddings"),
             "status": state.get("status", "completed"),
             "error_message": state.get("error_message"),
-            "metadata": metadata_json,
-            "created_at": state.get("created_at") or datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": state.get("completed_at") or datetime.now(timezone.utc).isoformat(),
+            # Passed as a dict: PostgREST encodes the request body once, and
+            # json_populate_record fills a JSONB (or legacy text) column from it
+            "metadata": state.get("metadata") or {},
+            "created_at": state.get("created_at") or now_iso,
+            "updated_at": now_iso,
+            "completed_at": state.get("completed_at") or now_iso,
             "retry_count": state.get("retry_count", 0),
             "current_node": state.get("current_node", "storage")
-        } 
\ No newline at end of file
+        }
+        
+        embeddings = state.get("embeddings")
+        if self.quantize_embeddings and embeddings is not None:
+            content_data["embeddings_int8"] = quantize_embedding(embeddings)
+        
+        return content_data 
\ No newline at end of file
@@ -5,16 +5,166 @@ DeepSeek offers excellent value at $0.27 input / $1.10 output per 1M tokens
 with 50% discount during off-peak hours.
 """
 
+import asyncio
+import atexit
+import hashlib
 import os
-from typing import Optional
+import re
+import threading
+from bisect import bisect_left
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple, cast
 from datetime import datetime, timezone
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from langsmith import traceable
 
+from src import config as app_config
 from ..state import ContentState, update_state_status
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..optimization import ContentCache
+
+# Delimiter the model is asked to put before each summary in a batched reply
+_BATCH_SUMMARY_RE = re.compile(r"^\s*=== SUMMARY (\d+) ===\s*$", re.MULTILINE)
+
+# Pooled DeepSeek connections shared by every SummarizerNode, so TCP/TLS
+# setup is paid once and concurrent requests multiplex over HTTP/2
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+class _RequestLimiter:
+    """Async cap on in-flight requests shared by every thread and event loop.
+    
+    The orchestrator runs items on worker threads, each under its own
+    ``asyncio.run``, so a per-loop ``asyncio.Semaphore`` would let each
+    thread use the whole quota. Waiters queue in FIFO order and are woken
+    on their own loop when a slot is handed to them.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._in_flight = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self._limit:
+                self._in_flight += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            if not queued:
+                # A release already handed this waiter its slot; pass it on
+                self._release()
+            raise
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, future)
+                    return
+                except RuntimeError:
+                    # The waiter's loop has closed, taking its task with it
+                    continue
+            self._in_flight -= 1
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    """Hand a freed slot to ``future``'s waiter unless it gave up already."""
+    if not future.done():
+        future.set_result(None)
+
+
+# One limiter per (base_url, api_key) so every node calling the same
+# DeepSeek account shares one process-wide cap
+_request_limiters: Dict[Tuple[str, Optional[str]], _RequestLimiter] = {}
+_request_limiters_lock = threading.Lock()
+
+
+def _shared_http_client() -> httpx.Client:
+    """Process-wide HTTP client for blocking DeepSeek calls."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(http2=True, limits=_HTTP_LIMITS)
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+class _AsyncSession:
+    """Async DeepSeek connection pool for one unit of work, and the LLMs using it."""
+
+    def __init__(self) -> None:
+        self.client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+        self.llms: Dict["SummarizerNode", ChatOpenAI] = {}
+
+
+# httpx async pools are bound to the event loop that opened their
+# connections, and the orchestrator runs each item under its own
+# ``asyncio.run``; a pool therefore lives only as long as the work using it
+_async_session: ContextVar[Optional[_AsyncSession]] = ContextVar("deepseek_async_session", default=None)
+
+
+@asynccontextmanager
+async def _deepseek_session() -> AsyncIterator[_AsyncSession]:
+    """Async DeepSeek pool shared by the calls made inside the block.
+    
+    Reuses the enclosing session if there is one; otherwise opens a pool and
+    closes it on exit, so no connections outlive the block's event loop.
+    """
+    session = _async_session.get()
+    if session is not None:
+        yield session
+        return
+    session = _AsyncSession()
+    token = _async_session.set(session)
+    try:
+        yield session
+    finally:
+        _async_session.reset(token)
+        await session.client.aclose()
+
+
+# Base instructions shared by every source type
+_BASE_INSTRUCTION = (
+    "Generate a concise, informative summary of the following content. "
+    "Focus on key points, main ideas, and actionable insights. "
+)
+
+
+def _build_prompt_prefixes(
+    base_instructions: Dict[str, str], length_instructions: Tuple[str, ...]
+) -> Dict[Tuple[Optional[str], int], str]:
+    """Prompt text preceding the content for every source type and length bucket."""
+    sources: Dict[Optional[str], str] = dict(base_instructions.items())
+    sources[None] = _BASE_INSTRUCTION
+    return {
+        (source_type, bucket): f"\n{base}\n{length}\n\nContent to summarize:\n"
+        for source_type, base in sources.items()
+        for bucket, length in enumerate(length_instructions)
+    }
+
 
 class SummarizerNode:
     """Node for generating content summaries using DeepSeek API.
@@ -23,12 +173,42 @@ class SummarizerNode:
     concise, informative summaries using DeepSeek's chat model.
     """
 
+    # Full base instructions per source type; others get _BASE_INSTRUCTION
+    _BASE_INSTRUCTIONS = {
+        "youtube": _BASE_INSTRUCTION + (
+            "This is a YouTube video transcript. Identify the main topic, "
+            "key learnings, and any recommendations or conclusions. "
+        ),
+        "reddit": _BASE_INSTRUCTION + (
+            "This is Reddit content. Capture the main discussion points, "
+            "popular opinions, and key insights from the community. "
+        ),
+    }
+
+    # Summary length by content length: more than 1000, 5000, 10000 characters
+    _LENGTH_THRESHOLDS = (1000, 5000, 10000)
+    _LENGTH_INSTRUCTIONS = (
+        "Provide a brief summary in 1 paragraph.",
+        "Provide a concise summary in 1-2 paragraphs.",
+        "Provide a detailed summary in 2-3 paragraphs.",
+        "Provide a comprehensive summary in 3-4 paragraphs.",
+    )
+
+    # Combined content characters per batched request, keeping the prompt
+    # well inside the model's context window; longer items go alone
+    _BATCH_MAX_CHARS = 20000
+
+    # Everything before the content, per (source type, length bucket);
+    # source types without their own instructions use the None entries
+    _PROMPT_PREFIXES = _build_prompt_prefixes(_BASE_INSTRUCTIONS, _LENGTH_INSTRUCTIONS)
+
     def __init__(
         self,
         model: str = "deepseek-chat",
         api_key: Optional[str] = None,
         max_tokens: Optional[int] = None,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        summary_cache: Optional["ContentCache"] = None
     ):
         """Initialize the SummarizerNode.
         
@@ -37,6 +217,9 @@ class SummarizerNode:
             api_key: DeepSeek API key (uses DEEPSEEK_API_KEY env var if None)
             max_tokens: Maximum tokens to generate (uses model default if None)
             temperature: Sampling temperature for generation
+            summary_cache: Cache for summaries keyed by the content itself, so
+                           re-shared or repeated content skips the LLM call
+                           (no caching if None)
         """
         self.model = model
         self.api_key = api_key or os.getenv('DEEPSEEK_API_KEY')
@@ -44,7 +227,7 @@ class SummarizerNode:
         self.temperature = temperature
         
         # Store initialization parameters for lazy loading
-        self._llm_kwargs = {
+        self._llm_kwargs: Dict[str, Any] = {
             "model": self.model,
             "base_url": "https://api.deepseek.com/v1",
             "api_key": self.api_key,
@@ -54,15 +237,53 @@ class SummarizerNode:
         if self.max_tokens:
             self._llm_kwargs["max_tokens"] = self.max_tokens
             
-        self._llm = None
+        self._summary_cache = summary_cache
+        # Generation settings are part of the key so changing them invalidates
+        self._summary_params = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
+        
+        self._llm: Optional[ChatOpenAI] = None
 
     @property
-    def llm(self):
+    def llm(self) -> ChatOpenAI:
         """Lazy-load the LLM to avoid API key validation during initialization."""
         if self._llm is None:
-            self._llm = ChatOpenAI(**self._llm_kwargs)
+            self._llm = ChatOpenAI(**self._llm_kwargs, http_client=_shared_http_client())
         return self._llm
 
+    def async_session(self) -> AsyncContextManager[_AsyncSession]:
+        """Context sharing one DeepSeek connection pool across the async calls inside it.
+        
+        The orchestrator opens one per item (or batch of items) so the pool is
+        closed with the work that used it. Async calls made outside any
+        session open and close their own.
+        """
+        return _deepseek_session()
+
+    def _async_llm(self, session: _AsyncSession) -> ChatOpenAI:
+        """LLM for async calls over ``session``'s connection pool."""
+        llm = session.llms.get(self)
+        if llm is None:
+            llm = session.llms[self] = ChatOpenAI(**self._llm_kwargs, http_async_client=session.client)
+        return llm
+
+    def _request_slot(self) -> _RequestLimiter:
+        """Limiter bounding this account's in-flight requests across the process.
+        
+        Sized by ``DEEPSEEK_CONCURRENCY`` so bursts from ``asyncio.gather``
+        and from concurrent orchestrator workers queue locally instead of
+        tripping DeepSeek's rate limit.
+        """
+        key = (self._llm_kwargs["base_url"], self.api_key)
+        with _request_limiters_lock:
+            limiter = _request_limiters.get(key)
+            if limiter is None:
+                limiter = _request_limiters[key] = _RequestLimiter(app_config.DEEPSEEK_CONCURRENCY)
+        return limiter
+
     @traceable(name="content_summarizer")
     def __call__(self, state: ContentState) -> ContentState:
         """Generate summary for the content in state.
@@ -75,39 +296,366 @@ class SummarizerNode:
         """
         try:
             # Get content to summarize (prefer processed over raw)
-            content = state.get("processed_content") or state.get("raw_content", "")
-            
-            if not content or not content.strip():
-                return update_state_status(
-                    state,
-                    status="error",
-                    current_node="summarizer",
-                    error_message="No content available for summarization (content is empty)"
-                )
+            content = self._content_to_summarize(state)
+            
+            if content is None:
+                return self._empty_content_state(state)
             
-            # Create appropriate prompt based on source type and content length
-            prompt = self._create_summary_prompt(state, content)
+            cache_key = self._summary_key(state, content)
+            cached = self._cached_summary(cache_key)
+            if cached is not None:
+                return self._summarized_state(state, cached)
             
             # Generate summary using DeepSeek
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
+            response = self.llm.invoke([self._summary_message(state, content)])
+            # DeepSeek chat replies are plain text
+            summary = cast(str, response.content)
+            self._store_summary(cache_key, summary)
+            return self._summarized_state(state, summary)
             
-            # Update state with summary
-            updated_state = state.copy()
-            updated_state["summary"] = response.content
-            updated_state["status"] = "summarized"
-            updated_state["current_node"] = "summarizer"
-            updated_state["updated_at"] = datetime.now(timezone.utc).isoformat()
+        except Exception as e:
+            return self._error_state(state, e)
+
+    @traceable(name="content_summarizer")
+    async def acall(self, state: ContentState) -> ContentState:
+        """Async variant of :meth:`__call__` using ``ainvoke``.
+        
+        The DeepSeek round-trip is awaited on the running event loop, so
+        several summaries (or a summary and an embedding) can be in flight
+        at once without a worker thread per request.
+        
+        Args:
+            state: ContentState containing raw_content or processed_content
+            
+        Returns:
+            Updated ContentState with summary and updated status
+        """
+        try:
+            content = self._content_to_summarize(state)
             
-            return updated_state
+            if content is None:
+                return self._empty_content_state(state)
+            
+            cache_key = self._summary_key(state, content)
+            cached = await self._acached_summary(cache_key)
+            if cached is not None:
+                return self._summarized_state(state, cached)
+            
+            async with self.async_session() as session, self._request_slot():
+                response = await self._async_llm(session).ainvoke([self._summary_message(state, content)])
+            summary = cast(str, response.content)
+            await self._astore_summary(cache_key, summary)
+            return self._summarized_state(state, summary)
             
         except Exception as e:
-            return update_state_status(
-                state,
-                status="error",
-                current_node="summarizer",
-                error_message=f"Summarization failed: {str(e)}"
-            )
+            return self._error_state(state, e)
+
+    @traceable(name="content_summarizer")
+    async def astream_call(
+        self,
+        state: ContentState,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        timeout: Optional[float] = None
+    ) -> ContentState:
+        """Streaming variant of :meth:`acall` using ``astream``.
+        
+        Tokens are consumed as DeepSeek produces them, so a slow generation
+        can be abandoned at ``timeout`` (or by cancelling the task, as
+        ``SmartRetryManager``'s timeout does) instead of waiting for the
+        complete response.
+        
+        Args:
+            state: ContentState containing raw_content or processed_content
+            on_chunk: Called with each piece of summary text as it arrives
+            timeout: Seconds to allow for the whole generation (no limit if None)
+            
+        Returns:
+            Updated ContentState with summary and updated status
+        """
+        try:
+            content = self._content_to_summarize(state)
+            
+            if content is None:
+                return self._empty_content_state(state)
+            
+            cache_key = self._summary_key(state, content)
+            cached = await self._acached_summary(cache_key)
+            if cached is not None:
+                return self._summarized_state(state, cached)
+            
+            chunks: List[str] = []
+            async with self.async_session() as session, self._request_slot(), asyncio.timeout(timeout):
+                async for chunk in self._async_llm(session).astream([self._summary_message(state, content)]):
+                    text = cast(str, chunk.content)
+                    if text:
+                        chunks.append(text)
+                        if on_chunk is not None:
+                            on_chunk(text)
+            
+            summary = "".join(chunks)
+            await self._astore_summary(cache_key, summary)
+            return self._summarized_state(state, summary)
+            
+        except TimeoutError:
+            return self._error_state(state, Exception(f"generation exceeded {timeout}s"))
+        except Exception as e:
+            return self._error_state(state, e)
+
+    @traceable(name="batch_content_summarizer")
+    def summarize_batch(self, states: List[ContentState], batch_size: int = 8) -> List[ContentState]:
+        """Summarize many states with one DeepSeek request per group.
+        
+        States are grouped by source type and summary length bucket, so each
+        group shares one set of instructions, and each group of up to
+        ``batch_size`` items (and ``_BATCH_MAX_CHARS`` characters of content)
+        is sent as a single numbered multi-item prompt. This amortizes the
+        per-request overhead across the group. Items longer than the largest
+        length threshold are always sent on their own.
+        
+        Args:
+            states: ContentStates containing raw_content or processed_content
+            batch_size: Maximum number of items per request
+            
+        Returns:
+            Updated ContentStates, in the same order as ``states``
+        """
+        contents, keys = self._batch_contents(states)
+        cached = [self._cached_summary(key) for key in keys]
+        results, groups = self._prepare_batch(states, contents, cached, batch_size)
+        for group in groups:
+            try:
+                response = self.llm.invoke([self._batch_message(states, group)], **self._batch_kwargs(group))
+            except Exception as e:
+                self._fail_group(states, results, group, e)
+            else:
+                for cache_key, summary in self._apply_group(states, results, group, cast(str, response.content)):
+                    self._store_summary(cache_key, summary)
+        # Every index is filled once all groups are applied
+        return cast(List[ContentState], results)
+
+    async def asummarize_batch(self, states: List[ContentState], batch_size: int = 8) -> List[ContentState]:
+        """Async variant of :meth:`summarize_batch` with the groups sent concurrently.
+        
+        Args:
+            states: ContentStates containing raw_content or processed_content
+            batch_size: Maximum number of items per request
+            
+        Returns:
+            Updated ContentStates, in the same order as ``states``
+        """
+        contents, keys = self._batch_contents(states)
+        cached = await asyncio.gather(*(self._acached_summary(key) for key in keys))
+        results, groups = self._prepare_batch(states, contents, cached, batch_size)
+        
+        async def summarize_group(session: _AsyncSession, group: List[Tuple[int, str]]) -> None:
+            try:
+                async with self._request_slot():
+                    response = await self._async_llm(session).ainvoke(
+                        [self._batch_message(states, group)], **self._batch_kwargs(group)
+                    )
+            except Exception as e:
+                self._fail_group(states, results, group, e)
+            else:
+                stores = self._apply_group(states, results, group, cast(str, response.content))
+                await asyncio.gather(*(self._astore_summary(key, summary) for key, summary in stores))
+        
+        async with self.async_session() as session:
+            await asyncio.gather(*(summarize_group(session, group) for group in groups))
+        return cast(List[ContentState], results)
+
+    def _batch_contents(
+        self, states: List[ContentState]
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Text to summarize and summary cache key per state (None where missing)."""
+        contents = [self._content_to_summarize(state) for state in states]
+        keys = [
+            self._summary_key(state, content) if content is not None else None
+            for state, content in zip(states, contents)
+        ]
+        return contents, keys
+
+    def _prepare_batch(
+        self,
+        states: List[ContentState],
+        contents: List[Optional[str]],
+        cached: List[Optional[str]],
+        batch_size: int,
+    ) -> Tuple[List[Optional[ContentState]], List[List[Tuple[int, str]]]]:
+        """Fill errors and cache hits, and group the rest for batched requests.
+        
+        ``contents`` and ``cached`` come from :meth:`_batch_contents` and the
+        summary cache, one entry per state.
+        
+        Returns the result list (``None`` where a summary is still needed) and
+        the groups, each a list of ``(index, content)`` pairs sharing a source
+        type and length bucket, within ``batch_size`` items and
+        ``_BATCH_MAX_CHARS`` characters.
+        """
+        results: List[Optional[ContentState]] = [None] * len(states)
+        buckets: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+        for i, (state, content, summary) in enumerate(zip(states, contents, cached)):
+            if content is None:
+                results[i] = self._empty_content_state(state)
+                continue
+            if summary is not None:
+                results[i] = self._summarized_state(state, summary)
+                continue
+            key = (state.get("source_type", "unknown"), self._length_instruction(len(content)))
+            buckets.setdefault(key, []).append((i, content))
+        
+        groups: List[List[Tuple[int, str]]] = []
+        for items in buckets.values():
+            group: List[Tuple[int, str]] = []
+            group_chars = 0
+            for item in items:
+                item_chars = len(item[1])
+                if item_chars > self._LENGTH_THRESHOLDS[-1]:
+                    groups.append([item])
+                    continue
+                if group and (len(group) >= batch_size or group_chars + item_chars > self._BATCH_MAX_CHARS):
+                    groups.append(group)
+                    group, group_chars = [], 0
+                group.append(item)
+                group_chars += item_chars
+            if group:
+                groups.append(group)
+        return results, groups
+
+    def _batch_kwargs(self, group: List[Tuple[int, str]]) -> Dict[str, Any]:
+        """Per-request overrides for a batched request covering ``group``.
+        
+        ``max_tokens`` caps the whole reply, so a multi-item request gets the
+        configured budget once per item instead of truncating later items.
+        """
+        if self.max_tokens and len(group) > 1:
+            return {"max_tokens": self.max_tokens * len(group)}
+        return {}
+
+    def _batch_message(self, states: List[ContentState], group: List[Tuple[int, str]]) -> HumanMessage:
+        """One prompt message asking for a delimited summary of every item in ``group``."""
+        first_index, first_content = group[0]
+        sections = "\n\n".join(
+            f"### Item {number}\n{content}" for number, (_, content) in enumerate(group, start=1)
+        )
+        prompt = f"""
+{self._base_instruction(states[first_index].get("source_type", "unknown"))}
+{self._length_instruction(len(first_content))}
+Summarize each of the {len(group)} items below separately. Begin each summary with a line
+"=== SUMMARY i ===", where i is the item number, and write nothing outside those sections.
+
+{sections}
+
+Summaries:"""
+        return HumanMessage(content=prompt)
+
+    def _apply_group(
+        self,
+        states: List[ContentState],
+        results: List[Optional[ContentState]],
+        group: List[Tuple[int, str]],
+        text: str,
+    ) -> List[Tuple[Optional[str], str]]:
+        """Split a batched reply on its delimiters and fill each item's result.
+        
+        Returns the ``(cache_key, summary)`` pairs for the caller to store.
+        """
+        parts = _BATCH_SUMMARY_RE.split(text)
+        summaries = {int(number): body.strip() for number, body in zip(parts[1::2], parts[2::2])}
+        stores = []
+        for number, (i, content) in enumerate(group, start=1):
+            summary = summaries.get(number)
+            if summary:
+                stores.append((self._summary_key(states[i], content), summary))
+                results[i] = self._summarized_state(states[i], summary)
+            else:
+                results[i] = self._error_state(
+                    states[i], Exception(f"batched response had no summary for item {number}")
+                )
+        return stores
+
+    def _fail_group(
+        self,
+        states: List[ContentState],
+        results: List[Optional[ContentState]],
+        group: List[Tuple[int, str]],
+        error: Exception,
+    ) -> None:
+        """Mark every item of a failed batched request as an error."""
+        for i, _ in group:
+            results[i] = self._error_state(states[i], error)
+
+    def _summary_key(self, state: ContentState, content: str) -> Optional[str]:
+        """Content-addressed cache key for ``content``, or None without a cache.
+        
+        Whitespace is normalized so re-shared text with different line breaks
+        still hits; the source type is included because it shapes the prompt.
+        """
+        if self._summary_cache is None:
+            return None
+        normalized = " ".join(content.split())
+        return hashlib.blake2b(
+            f"{state.get('source_type', 'unknown')}\0{normalized}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def _cached_summary(self, cache_key: Optional[str]) -> Optional[str]:
+        """Previously generated summary for ``cache_key``, if any."""
+        if cache_key is None or self._summary_cache is None:
+            return None
+        return self._summary_cache.get("summary", cache_key, self._summary_params)
+
+    def _store_summary(self, cache_key: Optional[str], summary: str) -> None:
+        """Remember ``summary`` under ``cache_key`` when caching is enabled."""
+        if cache_key is not None and self._summary_cache is not None:
+            self._summary_cache.set("summary", cache_key, summary, self._summary_params)
+
+    async def _acached_summary(self, cache_key: Optional[str]) -> Optional[str]:
+        """Async :meth:`_cached_summary`; the cache read runs off the event loop."""
+        if cache_key is None or self._summary_cache is None:
+            return None
+        return await self._summary_cache.aget("summary", cache_key, self._summary_params)
+
+    async def _astore_summary(self, cache_key: Optional[str], summary: str) -> None:
+        """Async :meth:`_store_summary`; the cache write runs off the event loop."""
+        if cache_key is not None and self._summary_cache is not None:
+            await self._summary_cache.aset("summary", cache_key, summary, self._summary_params)
+
+    def _content_to_summarize(self, state: ContentState) -> Optional[str]:
+        """Text to summarize for ``state``, or None if it has no content."""
+        content = state.get("processed_content") or state.get("raw_content", "")
+        if not content or not content.strip():
+            return None
+        return content
+
+    def _summary_message(self, state: ContentState, content: str) -> HumanMessage:
+        """Prompt message for ``content`` tailored to the state's source and length."""
+        return HumanMessage(content=self._create_summary_prompt(state, content))
+
+    def _summarized_state(self, state: ContentState, summary: str) -> ContentState:
+        """Copy of ``state`` carrying its generated summary."""
+        return cast(ContentState, state | {
+            "summary": summary,
+            "status": "summarized",
+            "current_node": "summarizer",
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    def _empty_content_state(self, state: ContentState) -> ContentState:
+        """Copy of ``state`` marked as failed because it has nothing to summarize."""
+        return update_state_status(
+            state,
+            status="error",
+            current_node="summarizer",
+            error_message="No content available for summarization (content is empty)"
+        )
+
+    def _error_state(self, state: ContentState, error: Exception) -> ContentState:
+        """Copy of ``state`` marked as failed in the summarizer node."""
+        return update_state_status(
+            state,
+            status="error",
+            current_node="summarizer",
+            error_message=f"Summarization failed: {str(error)}"
+        )
 
     def _create_summary_prompt(self, state: ContentState, content: str) -> str:
         """Create an appropriate summarization prompt based on content type and length.
@@ -119,45 +667,20 @@ class SummarizerNode:
         Returns:
             Formatted prompt string
         """
-        source_type = state.get("source_type", "unknown")
-        content_length = len(content)
-        
-        # Base instructions
-        base_instruction = (
-            "Generate a concise, informative summary of the following content. "
-            "Focus on key points, main ideas, and actionable insights. "
-        )
-        
-        # Adjust instructions based on source type
-        if source_type == "youtube":
-            base_instruction += (
-                "This is a YouTube video transcript. Identify the main topic, "
-                "key learnings, and any recommendations or conclusions. "
-            )
-        elif source_type == "reddit":
-            base_instruction += (
-                "This is Reddit content. Capture the main discussion points, "
-                "popular opinions, and key insights from the community. "
-            )
-        
-        # Adjust summary length based on content length
-        if content_length > 10000:
-            length_instruction = "Provide a comprehensive summary in 3-4 paragraphs."
-        elif content_length > 5000:
-            length_instruction = "Provide a detailed summary in 2-3 paragraphs."
-        elif content_length > 1000:
-            length_instruction = "Provide a concise summary in 1-2 paragraphs."
-        else:
-            length_instruction = "Provide a brief summary in 1 paragraph."
+        bucket = bisect_left(self._LENGTH_THRESHOLDS, len(content))
+        prefix = self._PROMPT_PREFIXES.get((state.get("source_type"), bucket))
+        if prefix is None:
+            prefix = self._PROMPT_PREFIXES[(None, bucket)]
         
         # Combine instructions with content
-        full_prompt = f"""
-{base_instruction}
-{length_instruction}
+        return f"{prefix}{content}\n\nSummary:"
 
-Content to summarize:
-{content}
+    @classmethod
+    def _base_instruction(cls, source_type: str) -> str:
+        """Summarization instructions, adjusted for the content's source type."""
+        return cls._BASE_INSTRUCTIONS.get(source_type, _BASE_INSTRUCTION)
 
-Summary:"""
-        
-        return full_prompt 
\ No newline at end of file
+    @classmethod
+    def _length_instruction(cls, content_length: int) -> str:
+        """Requested summary length for content of ``content_length`` characters."""
+        return cls._LENGTH_INSTRUCTIONS[bisect_left(cls._LENGTH_THRESHOLDS, content_length)]
@@ -9,16 +9,26 @@ This module implements performance optimizations based on monitoring insights:
 """
 
 import asyncio
+import atexit
+import functools
 import hashlib
-import json
+import re
+import sqlite3
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Tuple, TYPE_CHECKING
+from typing import AsyncIterator, Dict, List, Optional, Any, Callable, Tuple, TYPE_CHECKING, cast
 import logging
 
-from .state import ContentState, update_state_status
+import orjson
+
+from .nodes.content_fetcher import canonical_source_url
+from .state import ContentState
 from .monitoring import get_monitor
 from src import config as app_config
 
@@ -35,11 +45,56 @@ logger = logging.getLogger(__name__)
 
 # The cache now supports LRU-style eviction based on a configurable
 # maximum number of items (IH_CACHE_MAX_ITEMS).  When the limit is
-# exceeded the *oldest* cache files (based on modification timestamp)
-# are removed.  This prevents unbounded disk usage in long-running
-# orchestrations.
+# exceeded the *oldest* entries (by store time) are removed.  This
+# prevents unbounded disk usage in long-running orchestrations.
+#
+# Entries live in one SQLite database (``cache.db`` in ``cache_dir``),
+# so a hit is a single indexed SELECT instead of a stat + open + read
+# + parse of a per-key JSON file.
 # -------------------------------------------------------------
 
+# Blobs at least this large (mostly transcripts) are zlib-compressed on disk
+_COMPRESS_MIN_BYTES = 1024
+# First byte of a compressed blob; JSON text never starts with NUL
+_ZLIB_MARKER = b"\x00"
+
+
+def _encode_blob(content: Any) -> bytes:
+    """Serialize cache content, compressing large payloads.
+
+    orjson writes compact UTF-8 without escaping non-ASCII text, which
+    keeps non-English transcripts small and encodes far faster than json.
+    """
+    blob = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    if len(blob) >= _COMPRESS_MIN_BYTES:
+        return _ZLIB_MARKER + zlib.compress(blob, 3)
+    return blob
+
+
+def _decode_blob(blob: bytes) -> Any:
+    """Inverse of :func:`_encode_blob`; plain JSON blobs are read as-is."""
+    if blob[:1] == _ZLIB_MARKER:
+        blob = zlib.decompress(blob[1:])
+    return orjson.loads(blob)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_key(content_type: str, url: str, params_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Hash a cache key; memoized because get and set hash the same triple.
+
+    ``params_items`` holds ``(name, repr(value))`` pairs, so the memo matches
+    exactly what is hashed (``1`` and ``1.0`` compare equal but differ here).
+    """
+    # Feed the parts straight into the hash; no JSON round-trip needed
+    key_hash = hashlib.blake2b(digest_size=16)
+    key_hash.update(content_type.encode())
+    key_hash.update(b"\0")
+    key_hash.update(url.encode())
+    for name, value_repr in params_items:
+        key_hash.update(f"\0{name}={value_repr}".encode())
+    return key_hash.hexdigest()
+
+
 class ContentCache:
     """On-disk cache with adaptive TTL and LRU eviction."""
 
@@ -48,16 +103,21 @@ class ContentCache:
         cache_dir: str = ".cache",
         max_age_hours: int | None = None,
         max_items: int | None = None,
+        memory_items: int = 256,
     ) -> None:
         """Create a cache instance.
 
         Args:
-            cache_dir: Directory where cached JSON files are stored.
+            cache_dir: Directory holding the ``cache.db`` SQLite database.
             max_age_hours: Time-to-live for a cache entry; if *None* the
               value from ``IH_CACHE_MAX_AGE_HOURS`` is used.
             max_items: Maximum number of items to keep.  When the limit
-              is reached the oldest files are evicted.  If *None* the
+              is reached the oldest entries are evicted.  If *None* the
               value from ``IH_CACHE_MAX_ITEMS`` is applied.
+            memory_items: Number of recently used entries also kept
+              deserialized in process memory, so hot hits skip SQLite.
+              Values returned from memory are shared; treat them as
+              read-only.
         """
 
         # Resolve config fallbacks
@@ -68,8 +128,28 @@ class ContentCache:
         self.cache_dir.mkdir(exist_ok=True)
 
         self.max_age = timedelta(hours=max_age_hours)
+        # Compared against float store times on every hit
+        self.max_age_seconds = self.max_age.total_seconds()
         self.max_items = max_items
         
+        # Shared by the orchestrator's worker threads; access is serialized by _lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_dir / "cache.db", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, ts REAL NOT NULL, blob BLOB NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts)")
+        # Row count, so set only runs an eviction when the limit is exceeded
+        (self._count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        
+        # In-process LRU in front of SQLite: key -> (stored at, content)
+        self._mem: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._mem_cap = memory_items
+        
         # Simple hit/miss counters for performance monitoring
         self._hits: int = 0
         self._misses: int = 0
@@ -88,10 +168,10 @@ class ContentCache:
             params: Optional request parameters that influence the response.
 
         Returns:
-            Hex MD5 digest that uniquely identifies a cache entry.
+            Hex BLAKE2b digest that uniquely identifies a cache entry.
         """
-        data: Dict[str, Any] = {"type": content_type, "url": url, "params": params or {}}
-        return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        params_items = tuple((name, repr(value)) for name, value in sorted((params or {}).items()))
+        return _compute_key(content_type, url, params_items)
     
     def get(
         self,
@@ -105,31 +185,43 @@ class ContentCache:
         """
         try:
             cache_key = self._get_cache_key(content_type, url, params)
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            
-            if not cache_file.exists():
-                return None
+            with self._lock:
+                entry = self._mem.get(cache_key)
+                if entry is not None:
+                    if time.time() - entry[0] <= self.max_age_seconds:
+                        self._mem.move_to_end(cache_key)
+                        self._hits += 1
+                        logger.info(f"Cache hit for {content_type}: {url[:50]}...")
+                        return entry[1]
+                    del self._mem[cache_key]
                 
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-            
-            # Check if cache is still valid
-            cached_time = datetime.fromisoformat(cached_data['timestamp'])
-            if datetime.now() - cached_time > self.max_age:
-                cache_file.unlink()  # Remove expired cache
-                return None
+                row = self._conn.execute(
+                    "SELECT ts, blob FROM cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+                
+                if row is None:
+                    self._misses += 1
+                    return None
                 
+                # Check if cache is still valid
+                if time.time() - row[0] > self.max_age_seconds:
+                    with self._conn:
+                        deleted = self._conn.execute("DELETE FROM cache WHERE key = ?", (cache_key,))  # Remove expired cache
+                    self._count -= deleted.rowcount
+                    self._misses += 1
+                    return None
+                
+                self._hits += 1
+                content = _decode_blob(row[1])
+                self._remember(cache_key, row[0], content)
+            
             logger.info(f"Cache hit for {content_type}: {url[:50]}...")
-            self._hits += 1
-            return cached_data['content']
+            return content
             
         except Exception as e:
             logger.warning(f"Cache retrieval failed: {e}")
+            self._misses += 1
             return None
-        finally:
-            # Register miss if we are returning None
-            if 'cached_data' not in locals():
-                self._misses += 1
     
     def set(
         self,
@@ -141,45 +233,76 @@ class ContentCache:
         """Store content in cache and enforce LRU policy."""
         try:
             cache_key = self._get_cache_key(content_type, url, params)
-            cache_file = self.cache_dir / f"{cache_key}.json"
+            blob = _encode_blob(content)
             
-            cached_data = {
-                'timestamp': datetime.now().isoformat(),
-                'content': content,
-                'type': content_type,
-                'url': url,
-                'params': params or {}
-            }
+            now = time.time()
             
-            with open(cache_file, 'w') as f:
-                json.dump(cached_data, f, indent=2)
+            with self._lock, self._conn:
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO cache (key, ts, blob) VALUES (?, ?, ?)",
+                    (cache_key, now, blob),
+                )
+                if inserted.rowcount:
+                    self._count += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE cache SET ts = ?, blob = ? WHERE key = ?", (now, blob, cache_key)
+                    )
+                self._remember(cache_key, now, content)
+                # Enforce LRU eviction policy if we surpass the max_items limit;
+                # the oldest rows come straight off the ts index
+                if self.max_items and self._count > self.max_items:
+                    evicted = self._conn.execute(
+                        "DELETE FROM cache WHERE key IN "
+                        "(SELECT key FROM cache ORDER BY ts, rowid LIMIT ?) RETURNING key",
+                        (self._count - self.max_items,),
+                    ).fetchall()
+                    self._count -= len(evicted)
+                    for (evicted_key,) in evicted:
+                        self._mem.pop(evicted_key, None)
                 
             logger.debug(f"Cached {content_type}: {url[:50]}...")
             
         except Exception as e:
             logger.warning(f"Cache storage failed: {e}")
 
-        # Enforce LRU eviction policy if we surpass the max_items limit
-        try:
-            # Use cached "timestamp" field for deterministic ordering even
-            # when the filesystem modification times have identical
-            # resolution (Windows second-level granularity can cause ties).
-            def _file_ts(path: Path) -> float:
-                try:
-                    with path.open("r") as f:
-                        return datetime.fromisoformat(json.load(f)["timestamp"]).timestamp()
-                except Exception:
-                    # Fallback to file mtime if JSON parsing fails
-                    return path.stat().st_mtime
-
-            all_cache_files = sorted(self.cache_dir.glob("*.json"), key=_file_ts)
-            if self.max_items and len(all_cache_files) > self.max_items:
-                surplus = len(all_cache_files) - self.max_items
-                for old_file in all_cache_files[:surplus]:
-                    old_file.unlink(missing_ok=True)
-                    logger.debug(f"Evicted old cache file {old_file.name}")
-        except Exception as e:
-            logger.warning(f"Cache eviction check failed: {e}")
+    async def aget(
+        self,
+        content_type: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Any]:
+        """Async :meth:`get`; the SQLite read runs off the event loop."""
+        return await asyncio.to_thread(self.get, content_type, url, params)
+
+    async def aset(
+        self,
+        content_type: str,
+        url: str,
+        content: Any,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Async :meth:`set`; encoding and the SQLite write run off the event loop."""
+        await asyncio.to_thread(self.set, content_type, url, content, params)
+
+    def close(self) -> None:
+        """Close the SQLite connection; later lookups miss and stores are skipped."""
+        with self._lock:
+            self._conn.close()
+            self._mem.clear()
+
+    def __enter__(self) -> "ContentCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _remember(self, cache_key: str, stored_at: float, content: Any) -> None:
+        """Put an entry in the in-memory LRU, evicting the least recent (caller holds _lock)."""
+        self._mem[cache_key] = (stored_at, content)
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self._mem_cap:
+            self._mem.popitem(last=False)
 
     # ------------------------------------------------------------------
     # Metrics helpers
@@ -191,6 +314,14 @@ class ContentCache:
         return {"hits": self._hits, "misses": self._misses}
 
 
+# Error message fragments for each retry strategy; one scan finds them all
+_ERROR_TYPE_RE = re.compile(
+    r"(?P<rate_limit>rate limit|429)|(?P<network>network|timeout|connection)|(?P<api_error>api|401|403)"
+)
+# When a message matches several strategies, the first listed here wins
+_ERROR_TYPE_PRIORITY = ("rate_limit", "network", "api_error")
+
+
 class SmartRetryManager:
     """Intelligent retry logic with exponential backoff and error-specific strategies."""
     
@@ -203,19 +334,21 @@ class SmartRetryManager:
             "timeout": {"max_retries": 2, "base_delay": 10, "backoff": 2.0},
             "default": {"max_retries": 2, "base_delay": 5, "backoff": 2.0}
         }
+        # Upper bound on attempts for any strategy; tuning only changes delays
+        self._max_attempts = max(s["max_retries"] for s in self.retry_strategies.values()) + 1
     
     def classify_error(self, error: Exception) -> str:
         """Classify error type for appropriate retry strategy."""
-        error_str = str(error).lower()
+        found = set()
+        for match in _ERROR_TYPE_RE.finditer(str(error).lower()):
+            if match.lastgroup == "rate_limit":
+                return "rate_limit"
+            found.add(match.lastgroup)
         
-        if "rate limit" in error_str or "429" in error_str:
-            return "rate_limit"
-        elif "network" in error_str or "timeout" in error_str or "connection" in error_str:
-            return "network"
-        elif "api" in error_str or "401" in error_str or "403" in error_str:
-            return "api_error"
-        else:
-            return "default"
+        for error_type in _ERROR_TYPE_PRIORITY:
+            if error_type in found:
+                return error_type
+        return "default"
     
     async def retry_with_backoff(self, func: Callable, *args, **kwargs) -> Any:
         """Execute *func* with an adaptive retry strategy.
@@ -234,10 +367,15 @@ class SmartRetryManager:
         therefore safe and does not mask bugs.  This design choice aligns with
         the Aider CODE_QUALITY checklist requirement to avoid *swallowing*
         exceptions while still enabling category-based back-off tuning.
+
+        Cancellation is never retried: ``asyncio.CancelledError`` (like
+        ``KeyboardInterrupt``) derives from :class:`BaseException` and passes
+        straight through, including while waiting out a back-off delay,
+        which is always an ``asyncio.sleep`` so it cannot block the loop.
         """
         last_error = None
         
-        for attempt in range(max(s["max_retries"] for s in self.retry_strategies.values()) + 1):
+        for attempt in range(self._max_attempts):
             try:
                 if asyncio.iscoroutinefunction(func):
                     return await asyncio.wait_for(func(*args, **kwargs), timeout=self.timeout_seconds)
@@ -265,11 +403,7 @@ class SmartRetryManager:
                 
                 delay = strategy["base_delay"] * (strategy["backoff"] ** attempt)
                 logger.warning(f"Attempt {attempt + 1} failed ({error_type}), retrying in {delay}s: {error}")
-                
-                if asyncio.iscoroutinefunction(func):
-                    await asyncio.sleep(delay)
-                else:
-                    time.sleep(delay)
+                await asyncio.sleep(delay)
         
         raise last_error
 
@@ -375,12 +509,52 @@ class AdaptiveModelSelector:
                 logger.debug(f"AdaptiveModelSelector: updated {node_type} preferred tier → {preferred}")
 
 
+# Shared by every ParallelProcessor; created on first use, shut down at exit
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide node executor, creating it on first use.
+
+    The pool is sized by ``PARALLEL_NODE_WORKERS``.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=app_config.PARALLEL_NODE_WORKERS)
+                atexit.register(_EXECUTOR.shutdown, wait=False)
+    return _EXECUTOR
+
+
+def _workflow_id(state: ContentState) -> str:
+    """Monitoring workflow id the orchestrator stored on ``state``."""
+    # Added by OptimizedOrchestrator; not part of the ContentState schema
+    return cast(str, state.get("workflow_id", "unknown"))
+
+
+@asynccontextmanager
+async def _node_sessions(nodes: Dict[str, Callable]) -> AsyncIterator[None]:
+    """Keep each node's ``async_session`` open for the duration of the block.
+    
+    Nodes holding async connection pools (the summarizer) expose one so a
+    unit of work shares a pool that is closed before its event loop ends.
+    """
+    async with AsyncExitStack() as stack:
+        for node in nodes.values():
+            async_session = getattr(node, "async_session", None)
+            if async_session is not None:
+                await stack.enter_async_context(async_session())
+        yield
+
+
 class ParallelProcessor:
     """Utility for executing multiple independent LangGraph nodes in parallel.
 
     InsightHub workflows often perform I/O-bound steps that are safe to run
     concurrently (e.g. *summarizer* & *embedding* generation).  The
-    ``ParallelProcessor`` wraps a ``ThreadPoolExecutor`` and takes care of:
+    ``ParallelProcessor`` wraps the shared ``ThreadPoolExecutor`` and takes care of:
 
     • Submitting node callables with the shared ``ContentState``
     • Capturing per-node success / error metrics via :pyfunc:`get_monitor`
@@ -393,14 +567,13 @@ class ParallelProcessor:
     relies on the GIL-friendly nature of I/O heavy node implementations.
     """
     
-    def __init__(self, max_workers: int = 4):
-        self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+    def __init__(self) -> None:
+        self.executor = _get_executor()
     
     def execute_parallel_nodes(self, state: ContentState, node_functions: List[Tuple[str, Callable]]) -> ContentState:
         """Execute multiple independent nodes in parallel."""
         monitor = get_monitor()
-        workflow_id = state.get("workflow_id", "unknown")
+        workflow_id = _workflow_id(state)
         
         # Submit all tasks
         future_to_node = {}
@@ -420,29 +593,57 @@ class ParallelProcessor:
                 errors[node_name] = str(e)
                 logger.error(f"Parallel node {node_name} failed: {e}")
         
-        # Merge results into state
-        updated_state = state.copy()
+        return self._merge_results(state, results, errors)
+    
+    async def aexecute_parallel_nodes(self, state: ContentState, node_functions: List[Tuple[str, Callable]]) -> ContentState:
+        """Async variant of :meth:`execute_parallel_nodes`.
+        
+        Nodes exposing an ``acall`` coroutine are awaited directly on the
+        running loop, so their network waits overlap without a thread hop.
+        Plain callables still run on the thread pool.
+        """
+        workflow_id = _workflow_id(state)
+        node_names = [node_name for node_name, _ in node_functions]
+        outcomes = await asyncio.gather(
+            *(
+                self._aexecute_monitored_node(node_func, state, node_name, workflow_id)
+                for node_name, node_func in node_functions
+            ),
+            return_exceptions=True
+        )
+        
+        results = {}
+        errors = {}
+        for node_name, outcome in zip(node_names, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[node_name] = str(outcome)
+                logger.error(f"Parallel node {node_name} failed: {outcome}")
+            else:
+                results[node_name] = outcome
+        
+        return self._merge_results(state, results, errors)
+    
+    def _merge_results(self, state: ContentState, results: Dict[str, ContentState], errors: Dict[str, str]) -> ContentState:
+        """Merge per-node results and errors back into one state."""
+        delta: Dict[str, Any] = {}
         
         # Apply successful results
         for node_name, result_state in results.items():
             if node_name == "summarizer" and "summary" in result_state:
-                updated_state["summary"] = result_state["summary"]
+                delta["summary"] = result_state["summary"]
             elif node_name == "embedding" and "embeddings" in result_state:
-                updated_state["embeddings"] = result_state["embeddings"]
+                delta["embeddings"] = result_state["embeddings"]
         
         # Handle errors
         if errors:
             error_messages = [f"{node}: {msg}" for node, msg in errors.items()]
-            updated_state = update_state_status(
-                updated_state,
-                status="partial_failure",
-                error_message=f"Parallel processing errors: {'; '.join(error_messages)}"
-            )
+            delta["status"] = "partial_failure"
+            delta["error_message"] = f"Parallel processing errors: {'; '.join(error_messages)}"
         else:
-            updated_state["status"] = "processed"
+            delta["status"] = "processed"
         
-        updated_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-        return updated_state
+        delta["updated_at"] = datetime.now(timezone.utc).isoformat()
+        return cast(ContentState, state | delta)
     
     def _execute_monitored_node(self, node_func: Callable, state: ContentState, node_name: str, workflow_id: str) -> ContentState:
         """Execute a node with monitoring integration."""
@@ -451,7 +652,7 @@ class ParallelProcessor:
         
         start_time = time.time()
         try:
-            result = node_func(state)
+            result: ContentState = node_func(state)
             duration = time.time() - start_time
             monitor.complete_node(execution_id, "success")
             return result
@@ -460,10 +661,24 @@ class ParallelProcessor:
             monitor.complete_node(execution_id, "error", error_message=str(e))
             raise
     
-    def __del__(self):
-        """Clean up thread pool."""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
+    async def _aexecute_monitored_node(self, node_func: Callable, state: ContentState, node_name: str, workflow_id: str) -> ContentState:
+        """Await a node with monitoring integration, preferring its ``acall``."""
+        acall = getattr(node_func, "acall", None)
+        if acall is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, self._execute_monitored_node, node_func, state, node_name, workflow_id
+            )
+        
+        monitor = get_monitor()
+        execution_id = monitor.start_node(workflow_id, node_name)
+        try:
+            result: ContentState = await acall(state)
+            monitor.complete_node(execution_id, "success")
+            return result
+        except Exception as e:
+            monitor.complete_node(execution_id, "error", error_message=str(e))
+            raise
 
 
 class OptimizedOrchestrator:
@@ -479,40 +694,125 @@ class OptimizedOrchestrator:
         from src.orchestrator.optimization_tuner import OptimizerMetricsTuner as _MetricsTuner
 
         self._tuner: _MetricsTuner = _MetricsTuner(self.model_selector, self.retry_manager)
+
+    def close(self) -> None:
+        """Release resources held across workflows (the cache's SQLite connection)."""
+        self.cache.close()
     
     async def process_with_optimizations(self, state: ContentState, nodes: Dict[str, Callable]) -> ContentState:
         """Process content with all optimizations enabled."""
-        workflow_id = self.monitor.start_workflow(state.get("source_type", "unknown"))
-        state["workflow_id"] = workflow_id
+        async with _node_sessions(nodes):
+            workflow_id = self.monitor.start_workflow(state.get("source_type", "unknown"))
+            state["workflow_id"] = workflow_id
+            
+            try:
+                # Phase 1: Content Fetching (with caching)
+                if "content_fetcher" in nodes:
+                    state = await self._cached_content_fetch(state, nodes["content_fetcher"])
+            
+                # Phase 2: Parallel Processing (Summarizer + Embedding)
+                parallel_nodes = []
+                if "summarizer" in nodes:
+                    parallel_nodes.append(("summarizer", nodes["summarizer"]))
+                if "embedding" in nodes:
+                    parallel_nodes.append(("embedding", nodes["embedding"]))
+            
+                if parallel_nodes:
+                    state = await self.parallel_processor.aexecute_parallel_nodes(state, parallel_nodes)
+            
+                # Phase 3: Storage
+                if "storage" in nodes:
+                    state = await self.retry_manager.retry_with_backoff(nodes["storage"], state)
+            
+                # Periodic metrics-driven tuning
+                self._tuner.maybe_run()
+            
+                self.monitor.complete_workflow(workflow_id, "success")
+                return state
+            
+            except Exception as e:
+                self.monitor.complete_workflow(workflow_id, "error", error_message=str(e))
+                raise
+    
+    async def process_many(self, states: List[ContentState], nodes: Dict[str, Callable]) -> List[ContentState]:
+        """Process several items together, batching the LLM-bound phases.
         
-        try:
-            # Phase 1: Content Fetching (with caching)
-            if "content_fetcher" in nodes:
-                state = await self._cached_content_fetch(state, nodes["content_fetcher"])
+        Fetching and storage run per item as in :meth:`process_with_optimizations`.
+        Summaries go through the summarizer's ``asummarize_batch`` and
+        embeddings through ``aembed_batch`` when the nodes provide them, so
+        items sharing a prompt shape share one request. Embeddings are taken
+        after summarization, so they embed the summary where one exists. Each
+        item's results are merged as in the single-item path. The nodes'
+        async sessions stay open across the whole batch.
+        """
+        async with _node_sessions(nodes):
+            workflow_ids = [self.monitor.start_workflow(state.get("source_type", "unknown")) for state in states]
+            states = [
+                cast(ContentState, {**state, "workflow_id": workflow_id})
+                for state, workflow_id in zip(states, workflow_ids)
+            ]
             
-            # Phase 2: Parallel Processing (Summarizer + Embedding)
-            parallel_nodes = []
-            if "summarizer" in nodes:
-                parallel_nodes.append(("summarizer", nodes["summarizer"]))
-            if "embedding" in nodes:
-                parallel_nodes.append(("embedding", nodes["embedding"]))
+            try:
+                # Phase 1: Content Fetching (with caching)
+                if "content_fetcher" in nodes:
+                    states = list(await asyncio.gather(
+                        *(self._cached_content_fetch(state, nodes["content_fetcher"]) for state in states)
+                    ))
             
-            if parallel_nodes:
-                state = self.parallel_processor.execute_parallel_nodes(state, parallel_nodes)
+                # Phase 2: Batched Summarizer + Embedding
+                if "summarizer" in nodes or "embedding" in nodes:
+                    results: List[Dict[str, ContentState]] = [{} for _ in states]
+                    summarized = states
+                    if "summarizer" in nodes:
+                        summarized = await self._run_batch_node(nodes["summarizer"], "summarizer", "asummarize_batch", states)
+                        for result, state in zip(results, summarized):
+                            result["summarizer"] = state
+                    if "embedding" in nodes:
+                        embedded = await self._run_batch_node(nodes["embedding"], "embedding", "aembed_batch", summarized)
+                        for result, state in zip(results, embedded):
+                            result["embedding"] = state
+                    states = [
+                        self.parallel_processor._merge_results(state, result, {})
+                        for state, result in zip(states, results)
+                    ]
             
-            # Phase 3: Storage
-            if "storage" in nodes:
-                state = await self.retry_manager.retry_with_backoff(nodes["storage"], state)
+                # Phase 3: Storage
+                if "storage" in nodes:
+                    states = list(await asyncio.gather(
+                        *(self.retry_manager.retry_with_backoff(nodes["storage"], state) for state in states)
+                    ))
             
-            # Periodic metrics-driven tuning
-            self._tuner.maybe_run()
+                # Periodic metrics-driven tuning
+                self._tuner.maybe_run()
             
-            self.monitor.complete_workflow(workflow_id, "success")
-            return state
+            except Exception as e:
+                for workflow_id in workflow_ids:
+                    self.monitor.complete_workflow(workflow_id, "error", error_message=str(e))
+                raise
             
+            for workflow_id in workflow_ids:
+                self.monitor.complete_workflow(workflow_id, "success")
+            return states
+    
+    async def _run_batch_node(self, node: Callable, node_name: str, batch_method: str, states: List[ContentState]) -> List[ContentState]:
+        """Run ``node`` over ``states`` via its batch coroutine, or per item if it has none."""
+        run_batch = getattr(node, batch_method, None)
+        if run_batch is None:
+            return list(await asyncio.gather(*(
+                self.parallel_processor._aexecute_monitored_node(node, state, node_name, _workflow_id(state))
+                for state in states
+            )))
+        
+        execution_ids = [self.monitor.start_node(_workflow_id(state), node_name) for state in states]
+        try:
+            results: List[ContentState] = await run_batch(states)
         except Exception as e:
-            self.monitor.complete_workflow(workflow_id, "error", error_message=str(e))
+            for execution_id in execution_ids:
+                self.monitor.complete_node(execution_id, "error", error_message=str(e))
             raise
+        for execution_id in execution_ids:
+            self.monitor.complete_node(execution_id, "success")
+        return results
     
     async def _cached_content_fetch(self, state: ContentState, fetcher_node: Callable) -> ContentState:
         """Content fetching with intelligent caching."""
@@ -520,23 +820,22 @@ class OptimizedOrchestrator:
             "source_type": state["source_type"],
             "model_size": "base"  # For YouTube transcription
         }
+        # Key on the content itself so share links and tracking params hit too
+        cache_url = canonical_source_url(state["source_type"], state["source_url"])
         
         # Try cache first
-        cached_content = self.cache.get(
+        cached_content = await self.cache.aget(
             state["source_type"], 
-            state["source_url"], 
+            cache_url, 
             cache_key_params
         )
         
         if cached_content:
             # Use cached content
-            updated_state = state.copy()
-            updated_state.update(cached_content)
-            updated_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-            return updated_state
+            return cast(ContentState, state | cached_content | {"updated_at": datetime.now(timezone.utc).isoformat()})
         
         # Fetch with retry logic
-        result_state = await self.retry_manager.retry_with_backoff(fetcher_node, state)
+        result_state: ContentState = await self.retry_manager.retry_with_backoff(fetcher_node, state)
         
         # Cache the result
         if result_state.get("status") != "failed":
@@ -545,9 +844,9 @@ class OptimizedOrchestrator:
                 "content_id": result_state.get("content_id"),
                 "metadata": result_state.get("metadata", {})
             }
-            self.cache.set(
+            await self.cache.aset(
                 state["source_type"],
-                state["source_url"],
+                cache_url,
                 cache_data,
                 cache_key_params
             )
@@ -563,4 +862,5 @@ def get_optimizer() -> OptimizedOrchestrator:
     global _optimizer
     if _optimizer is None:
         _optimizer = OptimizedOrchestrator()
+        atexit.register(_optimizer.close)
     return _optimizer 
\ No newline at end of file
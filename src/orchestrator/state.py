@@ -13,6 +13,11 @@ class ContentState(TypedDict):
     
     This state is passed between nodes and tracks the complete lifecycle
     of content from initial fetching through final storage.
+    
+    Nodes treat the incoming state as shared (parallel nodes receive the
+    same object) and never mutate it. They return a new state built as
+    ``state | delta`` with only the keys they change, which shallow-copies
+    the mapping without touching large values such as ``raw_content``.
     """
     # Source identification
     source_type: Literal["youtube", "reddit"]
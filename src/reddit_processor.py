@@ -59,6 +59,9 @@ class RedditProcessor:
             client_secret=client_secret,
             user_agent=user_agent
         )
+        # Last submission loaded by fetch_post_by_id, kept for a following
+        # fetch_comments call: fetching a submission already loads its comments
+        self._loaded_submission: Optional[praw.models.Submission] = None
 
     def validate_subreddit(self, subreddit_name: str) -> bool:
         """
@@ -120,27 +123,51 @@ class RedditProcessor:
                 raise ValueError(f"Invalid sort_type: {sort_type}")
             
             for submission in submissions:
-                post = RedditPost(
-                    id=submission.id,
-                    title=submission.title,
-                    selftext=submission.selftext,
-                    url=submission.url,
-                    score=submission.score,
-                    num_comments=submission.num_comments,
-                    created_utc=submission.created_utc,
-                    subreddit=submission.subreddit.display_name,
-                    author=str(submission.author) if submission.author else "[deleted]",
-                    permalink=submission.permalink,
-                    is_self=submission.is_self,
-                    link_flair_text=submission.link_flair_text
-                )
-                posts.append(post)
+                posts.append(self._to_reddit_post(submission))
             
             return posts
             
         except Exception as e:
             raise ValueError(f"Failed to fetch posts from r/{subreddit_name}: {e}")
 
+    def fetch_post_by_id(self, post_id: str) -> RedditPost:
+        """
+        Fetches a single post directly by its ID.
+        
+        Args:
+            post_id: Reddit post ID (the base36 part of the URL after /comments/)
+            
+        Returns:
+            RedditPost object
+            
+        Raises:
+            ValueError: If the post is invalid or inaccessible
+        """
+        try:
+            submission = self.reddit.submission(id=post_id)
+            post = self._to_reddit_post(submission)
+        except Exception as e:
+            raise ValueError(f"Failed to fetch post {post_id}: {e}")
+        self._loaded_submission = submission
+        return post
+
+    def _to_reddit_post(self, submission: Any) -> RedditPost:
+        """Convert a PRAW submission into a RedditPost."""
+        return RedditPost(
+            id=submission.id,
+            title=submission.title,
+            selftext=submission.selftext,
+            url=submission.url,
+            score=submission.score,
+            num_comments=submission.num_comments,
+            created_utc=submission.created_utc,
+            subreddit=submission.subreddit.display_name,
+            author=str(submission.author) if submission.author else "[deleted]",
+            permalink=submission.permalink,
+            is_self=submission.is_self,
+            link_flair_text=submission.link_flair_text
+        )
+
     def fetch_comments(self, post_id: str, limit: int = 5) -> List[RedditComment]:
         """
         Fetches top comments from a specific post.
@@ -156,7 +183,10 @@ class RedditProcessor:
             ValueError: If post is invalid or inaccessible
         """
         try:
-            submission = self.reddit.submission(id=post_id)
+            submission = self._loaded_submission
+            if submission is None or submission.id != post_id:
+                submission = self.reddit.submission(id=post_id)
+            self._loaded_submission = None
             submission.comments.replace_more(limit=0)  # Remove "more comments" objects
             
             comments = []
@@ -5,6 +5,8 @@ import tempfile
 import faster_whisper
 import os
 import subprocess
+import threading
+from typing import Dict
 from src.config import TRANSCRIPTION_METHOD, AUDIO_SPEED_FACTOR
 import uuid
 
@@ -13,6 +15,22 @@ class YouTubeProcessor:
     A class to process YouTube videos by fetching their transcripts.
     """
 
+    def __init__(self) -> None:
+        # Loaded faster-whisper models keyed by size; loading dominates short clips
+        self._whisper_models: Dict[str, faster_whisper.WhisperModel] = {}
+        self._whisper_models_lock = threading.Lock()
+
+    def _get_whisper_model(self, model_size: str) -> faster_whisper.WhisperModel:
+        """Return the faster-whisper model for ``model_size``, loading it once."""
+        model = self._whisper_models.get(model_size)
+        if model is None:
+            with self._whisper_models_lock:
+                model = self._whisper_models.get(model_size)
+                if model is None:
+                    model = faster_whisper.WhisperModel(model_size)
+                    self._whisper_models[model_size] = model
+        return model
+
     def download_audio(self, url: str) -> str:
         """
         Downloads the audio from a YouTube URL to a temporary file.
@@ -83,7 +101,7 @@ class YouTubeProcessor:
             ValueError: If transcription fails.
         """
         try:
-            model = faster_whisper.WhisperModel(model_size)
+            model = self._get_whisper_model(model_size)
             segments, _ = model.transcribe(audio_path)
             # Concatenate the text from all segments
             full_transcript = "".join([segment.text for segment in segments])
@@ -3,17 +3,22 @@
 These tests cover:
 1. `ContentCache` basic store / retrieve and LRU eviction behaviour.
 2. `aggregate_workflow_metrics` helper aggregation logic.
+3. `SmartRetryManager.classify_error` strategy selection.
+4. `ParallelProcessor` thread pool sharing.
 """
 
+import asyncio
 import json
 import os
+import sqlite3
 import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 # Import target modules
-from src.orchestrator.optimization import ContentCache
+from src.orchestrator.optimization import ContentCache, ParallelProcessor, SmartRetryManager
 from src.orchestrator.monitoring.metrics import (
     NodeMetrics,
     WorkflowMetrics,
@@ -28,8 +33,7 @@ from src.orchestrator.monitoring.metrics import (
 
 def test_content_cache_store_and_retrieve():
     """Verify that items can be stored and retrieved successfully."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10)
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
 
         key_url = "https://example.com/article"
         payload = {"foo": "bar"}
@@ -39,22 +43,150 @@ def test_content_cache_store_and_retrieve():
         assert retrieved == payload, "Cached payload should be retrievable intact"
 
 
+def test_content_cache_compresses_large_entries():
+    """Large payloads are stored compressed and read back intact."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+        transcript = {"raw_content": "welcome back to the channel " * 500}
+        cache.set("youtube", "long", transcript)
+        cache.set("youtube", "short", {"raw_content": "hi"})
+
+        with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+            sizes = dict(conn.execute("SELECT key, length(blob) FROM cache"))
+        assert min(sizes.values()) < 100
+        assert max(sizes.values()) < len(transcript["raw_content"]) // 10
+
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as fresh:
+            assert fresh.get("youtube", "long") == transcript
+            assert fresh.get("youtube", "short") == {"raw_content": "hi"}
+
+
+def test_content_cache_stores_non_ascii_unescaped():
+    """Non-ASCII text is stored as UTF-8 rather than \\u escapes."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+        payload = {"raw_content": "Tämä on litterointi", "metadata": {1: "int key"}}
+        cache.set("youtube", "fi", payload)
+
+        with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+            (blob,) = conn.execute("SELECT blob FROM cache").fetchone()
+        assert "Tämä".encode() in blob
+
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as fresh:
+            assert fresh.get("youtube", "fi") == {"raw_content": "Tämä on litterointi", "metadata": {"1": "int key"}}
+
+
+def test_content_cache_key_ignores_param_order():
+    """Keys are stable across param ordering and distinct across inputs."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+
+        key = cache._get_cache_key("youtube", "url", {"a": 1, "b": "base"})
+        assert key == cache._get_cache_key("youtube", "url", {"b": "base", "a": 1})
+        assert key != cache._get_cache_key("youtube", "url", {"a": "1", "b": "base"})
+        assert key != cache._get_cache_key("reddit", "url", {"a": 1, "b": "base"})
+        assert cache._get_cache_key("youtube", "url") == cache._get_cache_key("youtube", "url", {})
+
+
+def test_content_cache_key_handles_unhashable_and_equal_params():
+    """List params hash deterministically; equal values with different reprs get distinct keys."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+
+        key = cache._get_cache_key("youtube", "url", {"langs": ["en", "fi"]})
+        assert key == cache._get_cache_key("youtube", "url", {"langs": ["en", "fi"]})
+        assert key != cache._get_cache_key("youtube", "url", {"langs": ["fi", "en"]})
+
+        int_key = cache._get_cache_key("youtube", "url", {"temperature": 1})
+        float_key = cache._get_cache_key("youtube", "url", {"temperature": 1.0})
+        assert int_key != float_key
+        assert float_key == cache._get_cache_key("youtube", "url", {"temperature": 1.0})
+
+
 def test_content_cache_lru_eviction():
-    """Ensure that the LRU eviction removes oldest files beyond max_items."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=2)
+    """Ensure that the LRU eviction removes oldest entries beyond max_items."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=2) as cache:
 
         # Insert three distinct items
         cache.set("type1", "url1", {"v": 1})
         cache.set("type1", "url2", {"v": 2})
         cache.set("type1", "url3", {"v": 3})  # Should trigger eviction
 
-        files = [p for p in os.listdir(tmpdir) if p.endswith(".json")]
-        assert len(files) == 2, "Cache should keep only `max_items` newest files"
+        with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        assert count == 2, "Cache should keep only `max_items` newest entries"
 
-        # The remaining files correspond to the most recent URLs (url2 and url3)
+        # The remaining entries correspond to the most recent URLs (url2 and url3)
         # Verify that url1 is evicted
         assert cache.get("type1", "url1") is None
+        assert cache.get("type1", "url3") == {"v": 3}
+
+
+def test_content_cache_eviction_counts_existing_rows():
+    """A reopened cache counts rows already on disk and replaced keys only once."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+        for i in range(3):
+            cache.set("type1", f"url{i}", {"v": i})
+
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=3) as smaller:
+            smaller.set("type1", "url2", {"v": "updated"})  # replace, no eviction
+            assert smaller.get("type1", "url0") == {"v": 0}
+            smaller.set("type1", "url3", {"v": 3})  # fourth row evicts the oldest
+
+            with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+                keys_left = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            assert keys_left == 3
+            assert smaller.get("type1", "url0") is None
+            assert smaller.get("type1", "url2") == {"v": "updated"}
+
+
+def test_content_cache_async_roundtrip():
+    """aget/aset go through the same store as the sync methods."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+
+        async def roundtrip():
+            await cache.aset("type1", "url1", {"data": "value1"}, {"p": 1})
+            return await cache.aget("type1", "url1", {"p": 1}), await cache.aget("type1", "url2")
+
+        assert asyncio.run(roundtrip()) == ({"data": "value1"}, None)
+        assert cache.get("type1", "url1", {"p": 1}) == {"data": "value1"}
+
+
+def test_content_cache_expires_stale_entries():
+    """Entries older than max_age are treated as misses and removed."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+        cache.set("article", "url", {"foo": "bar"})
+
+        with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+            conn.execute("UPDATE cache SET ts = ts - 7200")
+
+        # A fresh instance has no in-memory copy and reads the aged row
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as fresh:
+            assert fresh.get("article", "url") is None
+            assert fresh.stats == {"hits": 0, "misses": 1}
+
+
+def test_content_cache_serves_hot_entries_from_memory():
+    """Recently used entries are returned without reading SQLite."""
+    with tempfile.TemporaryDirectory() as tmpdir, ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10, memory_items=1) as cache:
+        cache.set("article", "url1", {"v": 1})
+        cache.set("article", "url2", {"v": 2})  # pushes url1 out of memory
+
+        with sqlite3.connect(os.path.join(tmpdir, "cache.db")) as conn:
+            conn.execute("UPDATE cache SET blob = '{\"v\": \"disk\"}'")
+
+        assert cache.get("article", "url2") == {"v": 2}
+        assert cache.get("article", "url1") == {"v": "disk"}
+
+
+def test_content_cache_close_releases_connection():
+    """After close the cache misses instead of raising, and the file can be reopened."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as cache:
+            cache.set("article", "url", {"foo": "bar"})
+
+        assert cache.get("article", "url") is None
+        cache.set("article", "other", {"foo": "baz"})  # logged and skipped
+
+        with ContentCache(cache_dir=tmpdir, max_age_hours=1, max_items=10) as reopened:
+            assert reopened.get("article", "url") == {"foo": "bar"}
+            assert reopened.get("article", "other") is None
 
 
 # ---------------------------------------------------------------------------
@@ -100,4 +232,75 @@ def test_aggregate_workflow_metrics():
     embedding_stats = metrics["embedding"]
     assert embedding_stats["count"] == 3
     assert embedding_stats["error_rate"] == 0.0
-    assert embedding_stats["p95_duration"] >= 4 - 0.5 
\ No newline at end of file
+    assert embedding_stats["p95_duration"] >= 4 - 0.5 
+
+def test_workflow_metrics_to_dict_round_trip():
+    """to_dict emits ISO timestamps for workflow and nodes and from_dict restores them."""
+    wf = _create_wf({"summarizer": 5, "embedding": 2})
+
+    data = wf.to_dict()
+
+    assert list(data) == [
+        "workflow_id", "start_time", "end_time", "duration", "status",
+        "content_type", "nodes", "total_tokens", "total_cost", "error_message",
+    ]
+    assert data["start_time"] == wf.start_time.isoformat()
+    assert data["end_time"] == wf.end_time.isoformat()
+    assert [n["node_name"] for n in data["nodes"]] == ["summarizer", "embedding"]
+    assert data["nodes"][0]["start_time"] == wf.nodes[0].start_time.isoformat()
+    assert data["nodes"][0]["duration"] == 5
+
+    restored = WorkflowMetrics.from_dict(json.loads(json.dumps(data)))
+    assert restored == wf
+
+
+# ---------------------------------------------------------------------------
+# Retry classification tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Rate limit exceeded", "rate_limit"),
+        ("Connection reset after HTTP 429", "rate_limit"),
+        ("Read timeout from upstream", "network"),
+        ("API returned 401 on connection", "network"),
+        ("Invalid API key", "api_error"),
+        ("HTTP 403 Forbidden", "api_error"),
+        ("Something odd happened", "default"),
+    ],
+)
+def test_classify_error_prefers_rate_limit_then_network(message, expected):
+    """Messages matching several strategies resolve in priority order."""
+    assert SmartRetryManager().classify_error(Exception(message)) == expected
+
+
+# ---------------------------------------------------------------------------
+# ParallelProcessor tests
+# ---------------------------------------------------------------------------
+
+
+def test_parallel_processors_share_one_executor():
+    """Every ParallelProcessor reuses the process-wide thread pool."""
+    assert ParallelProcessor().executor is ParallelProcessor().executor
+
+
+def test_retry_backoff_for_sync_callables_is_cancellable():
+    """Back-off after a sync failure yields to the loop and stops on cancellation."""
+    calls = []
+
+    def flaky_storage():
+        calls.append(1)
+        raise ConnectionError("network unreachable")
+
+    async def run():
+        await asyncio.wait_for(SmartRetryManager().retry_with_backoff(flaky_storage), timeout=0.1)
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+
+    # The 5s network back-off was cancelled instead of blocking the loop
+    assert time.monotonic() - started < 2
+    assert calls == [1]
@@ -7,7 +7,7 @@ to appropriate processors based on source_type.
 import pytest
 from unittest.mock import Mock, patch
 from src.orchestrator.state import ContentState, create_content_state, YouTubeMetadata, RedditMetadata
-from src.orchestrator.nodes.content_fetcher import ContentFetcherNode
+from src.orchestrator.nodes.content_fetcher import ContentFetcherNode, canonical_source_url
 
 
 class TestContentFetcherNode:
@@ -64,7 +64,7 @@ class TestContentFetcherNode:
         mock_reddit_post.selftext = "This is a test post"
         mock_reddit_post.subreddit = "python"
         
-        mock_processor_instance.fetch_posts.return_value = [mock_reddit_post]
+        mock_processor_instance.fetch_post_by_id.return_value = mock_reddit_post
         mock_processor_instance.process_post_content.return_value = "Processed Reddit content"
         mock_reddit_processor.return_value = mock_processor_instance
 
@@ -90,6 +90,36 @@ class TestContentFetcherNode:
         assert metadata["post_id"] == "test123"
         assert metadata["subreddit"] == "python"
 
+        # The post is fetched directly by ID rather than found in a listing
+        mock_processor_instance.fetch_post_by_id.assert_called_once_with("test123")
+        mock_processor_instance.fetch_posts.assert_not_called()
+
+    @patch('src.orchestrator.nodes.content_fetcher.RedditProcessor')
+    def test_reddit_url_without_post_id_uses_newest_post(self, mock_reddit_processor):
+        """Test that subreddit URLs fall back to the newest post."""
+        mock_processor_instance = Mock()
+        mock_reddit_post = Mock()
+        mock_reddit_post.id = "newest1"
+        mock_reddit_post.subreddit = "python"
+
+        mock_processor_instance.fetch_posts.return_value = [mock_reddit_post]
+        mock_processor_instance.process_post_content.return_value = "Processed Reddit content"
+        mock_reddit_processor.return_value = mock_processor_instance
+
+        node = ContentFetcherNode()
+        state = create_content_state(
+            source_type="reddit",
+            source_url="https://www.reddit.com/r/python/"
+        )
+
+        result = node(state)
+
+        assert result["content_id"] == "newest1"
+        mock_processor_instance.fetch_posts.assert_called_once_with(
+            subreddit_name="python", limit=1, sort_type="new"
+        )
+        mock_processor_instance.fetch_post_by_id.assert_not_called()
+
     def test_updates_state_with_youtube_metadata(self):
         """Test that YouTube content fetching includes proper metadata."""
         with patch('src.orchestrator.nodes.content_fetcher.YouTubeProcessor') as mock_youtube:
@@ -145,7 +175,7 @@ class TestContentFetcherNode:
         with patch('src.orchestrator.nodes.content_fetcher.RedditProcessor') as mock_reddit:
             # Setup mock to raise exception
             mock_processor = Mock()
-            mock_processor.fetch_posts.side_effect = ValueError("Subreddit not found")
+            mock_processor.fetch_post_by_id.side_effect = ValueError("Post not found")
             mock_reddit.return_value = mock_processor
 
             node = ContentFetcherNode()
@@ -160,7 +190,7 @@ class TestContentFetcherNode:
             # Assert error handling
             assert result["status"] == "failed"
             assert result["current_node"] == "content_fetcher"
-            assert "Subreddit not found" in result["error_message"]
+            assert "Post not found" in result["error_message"]
             assert result["raw_content"] is None
 
     def test_handles_invalid_source_type(self):
@@ -193,7 +223,7 @@ class TestContentFetcherNode:
             mock_post.selftext = "Content"
             mock_post.subreddit = "test"
             
-            mock_processor.fetch_posts.return_value = [mock_post]
+            mock_processor.fetch_post_by_id.return_value = mock_post
             mock_processor.process_post_content.return_value = "Content"
             mock_reddit.return_value = mock_processor
 
@@ -212,6 +242,7 @@ class TestContentFetcherNode:
                 
                 # The content_id should be extracted from the URL or the fetched post
                 assert result["content_id"] is not None
+                mock_processor.fetch_post_by_id.assert_called_with("abc123")
 
     def test_preserves_original_state_fields(self):
         """Test that the node preserves fields from the original state that shouldn't change."""
@@ -259,4 +290,15 @@ class TestContentFetcherNode:
 
             # Assert timestamps
             assert result["updated_at"] != original_updated_at  # Should be updated
-            assert result["completed_at"] is None  # Should not be completed yet 
\ No newline at end of file
+            assert result["completed_at"] is None  # Should not be completed yet 
+
+
+@pytest.mark.parametrize("source_type, url, expected", [
+    ("youtube", "https://youtu.be/abc123?t=42", "https://www.youtube.com/watch?v=abc123"),
+    ("youtube", "https://m.youtube.com/watch?v=abc123&utm_source=x", "https://www.youtube.com/watch?v=abc123"),
+    ("reddit", "https://reddit.com/r/python/comments/xyz9/title/?utm_source=share", "https://www.reddit.com/comments/xyz9/"),
+    ("reddit", "https://www.reddit.com/r/python/", "https://www.reddit.com/r/python/"),
+])
+def test_canonical_source_url(source_type, url, expected):
+    """Equivalent URLs for the same video/post map to one cache key."""
+    assert canonical_source_url(source_type, url) == expected
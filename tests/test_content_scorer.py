@@ -12,7 +12,7 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, Any
 
 from src.orchestrator.state import ContentState
-from src.orchestrator.nodes.content_scorer import ContentScorer
+from src.orchestrator.nodes.content_scorer import ContentScorer, _parse_iso_datetime
 
 
 class TestContentScorer:
@@ -249,6 +249,41 @@ class TestContentScorer:
         
         assert recent_score > old_score, "Recent content should score higher than old content"
 
+    def test_recency_scoring_with_epoch_timestamp(self):
+        """Test that numeric epoch timestamps (Reddit created_utc) are aged like ISO dates."""
+        scorer = ContentScorer()
+        now = datetime.now(timezone.utc)
+        
+        recent_post: ContentState = {
+            "source_type": "reddit",
+            "metadata": {"created_utc": (now - timedelta(days=2, hours=1)).timestamp()}
+        }
+        iso_post: ContentState = {
+            "source_type": "reddit",
+            "metadata": {"created_utc": (now - timedelta(days=2, hours=1)).isoformat()}
+        }
+        
+        assert scorer._days_since_publication(recent_post, now) == 2
+        assert scorer._score_recency(recent_post, now) == scorer._score_recency(iso_post, now)
+
+    @pytest.mark.parametrize("value", [
+        "2025-06-29T10:00:00Z",
+        "2025-06-29T10:00:00.250Z",
+        "2025-06-29T10:00:00+02:00",
+        "2025-06-29T10:00:00",
+    ])
+    def test_parse_iso_datetime_matches_fromisoformat(self, value):
+        """Test that the fixed-format fast path parses like datetime.fromisoformat."""
+        expected = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        
+        assert _parse_iso_datetime(value) == expected
+        assert _parse_iso_datetime(value).tzinfo == expected.tzinfo
+
+    def test_parse_iso_datetime_rejects_invalid_dates(self):
+        """Test that malformed canonical-shaped strings still raise ValueError."""
+        with pytest.raises(ValueError):
+            _parse_iso_datetime("2025-13-29T10:00:00Z")
+
     def test_content_length_optimization(self):
         """Test content length scoring that penalizes too short or too long content."""
         scorer = ContentScorer()
@@ -419,4 +454,71 @@ class TestContentScorer:
         result = scorer(empty_summary_state)
         
         assert "relevance_score" in result
-        assert 0 <= result["relevance_score"] <= 1 
\ No newline at end of file
+        assert 0 <= result["relevance_score"] <= 1 
+    def test_score_batch_matches_per_item_scores(self):
+        """Test that batch scoring agrees with scoring each item individually."""
+        scorer = ContentScorer()
+        
+        base_state: ContentState = {
+            "source_type": "youtube",
+            "source_url": "https://youtube.com/watch?v=test123",
+            "content_id": "test123",
+            "raw_content": "Content...",
+            "processed_content": None,
+            "summary": "Comprehensive tutorial with a detailed analysis.",
+            "embeddings": [0.1, 0.2, 0.3],
+            "status": "completed",
+            "current_node": "scorer",
+            "error_message": None,
+            "retry_count": 0,
+            "metadata": {"view_count": 100000, "like_count": 5000, "duration": 1200},
+            "created_at": "2025-06-29T10:00:00Z",
+            "updated_at": "2025-06-29T10:30:00Z",
+            "completed_at": None
+        }
+        states = [
+            base_state,
+            {**base_state, "metadata": {"duration": 90, "published_at": "not a date"}},
+            {
+                **base_state,
+                "source_type": "reddit",
+                "raw_content": "x" * 1000,
+                "metadata": {
+                    "score": 250,
+                    "num_comments": 40,
+                    "subreddit": "python",
+                    "published_at": (datetime.now(timezone.utc) - timedelta(days=45)).isoformat()
+                }
+            },
+            {**base_state, "source_type": "blog", "summary": None, "raw_content": "", "metadata": {}},
+        ]
+        
+        batch_scores = scorer.score_batch(states)
+        
+        assert batch_scores.shape == (len(states),)
+        assert list(batch_scores) == pytest.approx([scorer(state)["relevance_score"] for state in states])
+        assert scorer.score_batch([]).shape == (0,)
+
+    def test_zero_weight_components_are_skipped(self):
+        """Test that components with zero weight are never evaluated."""
+        scorer = ContentScorer(scoring_weights={
+            "content_quality": 0.5,
+            "engagement_metrics": 0.5,
+            "recency": 0.0,
+            "source_credibility": 0.0,
+            "content_length": 0.0
+        })
+        state: ContentState = {
+            "source_type": "reddit",
+            "summary": "A detailed tutorial.",
+            "metadata": {"score": 100, "num_comments": 10, "published_at": "2025-06-29T10:00:00Z"}
+        }
+        
+        with patch.object(scorer, "_days_since_publication") as mock_days:
+            score = scorer(state)["relevance_score"]
+            batch_scores = scorer.score_batch([state])
+        
+        mock_days.assert_not_called()
+        expected = 0.5 * scorer._score_content_quality(state) + 0.5 * scorer._score_engagement_metrics(state)
+        assert score == pytest.approx(expected)
+        assert batch_scores[0] == pytest.approx(expected)
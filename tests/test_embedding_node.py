@@ -5,11 +5,13 @@ for content using OpenAI's text-embedding-ada-002 model.
 Since DeepSeek doesn't have embedding models, we use OpenAI for embeddings.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import numpy as np
 from src.orchestrator.state import ContentState, create_content_state
-from src.orchestrator.nodes.embedding import EmbeddingNode
+from src.orchestrator.nodes.embedding import EmbeddingCache, EmbeddingNode
 from unittest.mock import ANY
 
 
@@ -197,6 +199,56 @@ class TestEmbeddingNode:
         assert "error_message" in result
         assert "OpenAI API error" in result["error_message"]
 
+    @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
+    def test_embed_batch_uses_one_request_per_chunk(self, mock_embeddings):
+        """Test that embed_batch sends chunks to embed_documents and keeps order."""
+        mock_embedding_instance = Mock()
+        mock_embedding_instance.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        mock_embeddings.return_value = mock_embedding_instance
+        
+        states = []
+        for i, summary in enumerate(["first", "", "third item", "fourth"]):
+            state = create_content_state(
+                source_type="youtube",
+                source_url=f"https://youtube.com/watch?v=test{i}",
+                content_id=f"test{i}"
+            )
+            state["summary"] = summary
+            states.append(state)
+        
+        node = EmbeddingNode()
+        results = node.embed_batch(states, batch_size=2)
+        
+        assert mock_embedding_instance.embed_documents.call_count == 2
+        mock_embedding_instance.embed_query.assert_not_called()
+        assert [r["status"] for r in results] == ["embedded", "error", "embedded", "embedded"]
+        assert results[0]["embeddings"] == [5.0]
+        assert results[2]["embeddings"] == [10.0]
+        assert results[3]["embeddings"] == [6.0]
+        assert "no content" in results[1]["error_message"].lower()
+
+    @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
+    def test_embed_batch_marks_failed_chunk(self, mock_embeddings):
+        """Test that an API error fails only the items of the affected chunk."""
+        mock_embedding_instance = Mock()
+        mock_embedding_instance.embed_documents.side_effect = [[[0.1], [0.2]], Exception("OpenAI API error")]
+        mock_embeddings.return_value = mock_embedding_instance
+        
+        states = []
+        for i in range(3):
+            state = create_content_state(
+                source_type="youtube",
+                source_url=f"https://youtube.com/watch?v=test{i}",
+                content_id=f"test{i}"
+            )
+            state["summary"] = f"Summary {i}"
+            states.append(state)
+        
+        results = EmbeddingNode().embed_batch(states, batch_size=2)
+        
+        assert [r["status"] for r in results] == ["embedded", "embedded", "error"]
+        assert "OpenAI API error" in results[2]["error_message"]
+
     @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
     def test_embedding_preserves_state_fields(self, mock_embeddings):
         """Test that EmbeddingNode preserves all existing state fields."""
@@ -276,6 +328,123 @@ class TestEmbeddingNode:
         assert result["status"] == "embedded"
         mock_embedding_instance.embed_query.assert_called_once()
 
+    @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
+    def test_acall_uses_async_embeddings(self, mock_embeddings):
+        """Test that acall awaits aembed_query instead of blocking."""
+        mock_embedding_instance = Mock()
+        mock_embedding_instance.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        mock_embeddings.return_value = mock_embedding_instance
+        
+        state = create_content_state(
+            source_type="youtube",
+            source_url="https://youtube.com/watch?v=test123",
+            content_id="test123"
+        )
+        state["summary"] = "This is a test summary"
+        
+        result = asyncio.run(EmbeddingNode().acall(state))
+        
+        assert result["embeddings"] == [0.1, 0.2, 0.3]
+        assert result["status"] == "embedded"
+        mock_embedding_instance.aembed_query.assert_awaited_once_with("This is a test summary")
+        mock_embedding_instance.embed_query.assert_not_called()
+
+    @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
+    def test_aembed_batch_runs_chunks_concurrently(self, mock_embeddings):
+        """Test that aembed_batch overlaps requests up to max_concurrency."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_aembed_documents(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if texts == ["Summary 4"]:
+                raise Exception("OpenAI API error")
+            return [[float(len(t))] for t in texts]
+        
+        mock_embedding_instance = Mock()
+        mock_embedding_instance.aembed_documents.side_effect = fake_aembed_documents
+        mock_embeddings.return_value = mock_embedding_instance
+        
+        states = []
+        for i in range(5):
+            state = create_content_state(
+                source_type="youtube",
+                source_url=f"https://youtube.com/watch?v=test{i}",
+                content_id=f"test{i}"
+            )
+            state["summary"] = f"Summary {i}"
+            states.append(state)
+        
+        results = asyncio.run(EmbeddingNode().aembed_batch(states, batch_size=1, max_concurrency=2))
+        
+        assert peak == 2
+        assert [r["status"] for r in results] == ["embedded"] * 4 + ["error"]
+        assert results[0]["embeddings"] == [9.0]
+
+    @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
+    def test_embedding_cache_reuses_vectors_across_nodes(self, mock_embeddings, tmp_path):
+        """Test that cached embeddings are served without calling OpenAI again."""
+        mock_embedding_instance = Mock()
+        mock_embedding_instance.embed_query.return_value = [0.25, -0.5, 0.125]
+        mock_embedding_instance.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        mock_embeddings.return_value = mock_embedding_instance
+        cache_path = str(tmp_path / "embeddings.sqlite")
+        
+        state = create_content_state(
+            source_type="youtube",
+            source_url="https://youtube.com/watch?v=test123",
+            content_id="test123"
+        )
+        state["summary"] = "Cached summary"
+        other = {**state, "summary": "Another summary"}
+        
+        first = EmbeddingNode(cache_path=cache_path)(state)
+        # A fresh node on the same file sees the stored vector
+        second_node = EmbeddingNode(cache_path=cache_path)
+        second = second_node(state)
+        batch = second_node.embed_batch([state, other])
+        
+        assert mock_embedding_instance.embed_query.call_count == 1
+        assert first["embeddings"] == second["embeddings"] == [0.25, -0.5, 0.125]
+        mock_embedding_instance.embed_documents.assert_called_once_with(["Another summary"])
+        assert batch[0]["embeddings"] == [0.25, -0.5, 0.125]
+        assert batch[1]["embeddings"] == [15.0]
+
+    def test_embedding_cache_prunes_least_recently_used(self, tmp_path):
+        """Test that the cache keeps at most max_items vectors, dropping the oldest."""
+        cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite"), max_items=2)
+        cache.set_many({"a": [1.0]})
+        cache.set_many({"b": [2.0]})
+        cache.get_many(["a"])
+        cache.set_many({"c": [3.0]})
+        
+        assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+    def test_truncate_content_counts_tokens_with_tokenizer(self):
+        """Test that truncation cuts at the token limit when a tokenizer is available."""
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text, disallowed_special: text.split(" ")
+        encoding.decode.side_effect = lambda ids: " ".join(ids)
+        
+        node = EmbeddingNode(max_tokens=10)
+        node._encoding = encoding
+        
+        assert node._truncate_content("one two three four five six") == "one two three four five six"
+        assert node._truncate_content("word " * 30) == " ".join(["word"] * 10)
+
+    @patch('src.orchestrator.nodes.embedding.tiktoken.encoding_for_model', side_effect=KeyError("no tokenizer"))
+    def test_truncate_content_falls_back_without_tokenizer(self, mock_encoding_for_model):
+        """Test that truncation falls back to the character estimate if tiktoken fails."""
+        node = EmbeddingNode(max_tokens=10)
+        
+        assert node._truncate_content("x" * 100) == "x" * 40
+        assert node._truncate_content("x" * 100) == "x" * 40
+        mock_encoding_for_model.assert_called_once()
+
     @patch('src.orchestrator.nodes.embedding.OpenAIEmbeddings')
     def test_embedding_dimension_validation(self, mock_embeddings):
         """Test that EmbeddingNode validates embedding dimensions."""
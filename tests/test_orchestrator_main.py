@@ -201,6 +201,21 @@ class TestOrchestrator:
             assert len(completed) == 3
             assert len(failed) == 2
             
+    def test_optimized_nodes_are_built_once(self):
+        """Test that the optimizer path reuses node instances across items."""
+        with patch('src.orchestrator.main.create_orchestrator_graph'), \
+             patch('src.orchestrator.main.StorageNode') as mock_storage, \
+             patch('src.orchestrator.main.ContentFetcherNode'), \
+             patch('src.orchestrator.main.SummarizerNode'), \
+             patch('src.orchestrator.main.EmbeddingNode') as mock_embedding:
+            orchestrator = Orchestrator()
+            first = orchestrator._get_optimized_nodes()
+            second = orchestrator._get_optimized_nodes()
+            
+            assert first is second
+            mock_storage.assert_called_once()
+            mock_embedding.assert_called_once()
+            
     def test_get_processing_status_idle(self):
         """Test getting processing status when orchestrator is idle."""
         with patch('src.orchestrator.main.create_orchestrator_graph'):
@@ -113,6 +113,44 @@ class TestRedditProcessor:
             with pytest.raises(ValueError, match="Subreddit 'invalid' is invalid or inaccessible"):
                 processor.fetch_posts("invalid")
 
+    @patch('src.reddit_processor.praw.Reddit')
+    def test_fetch_post_by_id_returns_reddit_post(self, mock_reddit: Mock) -> None:
+        """Test that fetch_post_by_id fetches a single submission by ID."""
+        with patch.dict(os.environ, {
+            'REDDIT_CLIENT_ID': 'test_id',
+            'REDDIT_SECRET': 'test_secret'
+        }):
+            mock_submission = Mock()
+            mock_submission.id = "test123"
+            mock_submission.title = "Test Post"
+            mock_submission.selftext = "Test content"
+            mock_submission.url = "https://example.com"
+            mock_submission.score = 100
+            mock_submission.num_comments = 5
+            mock_submission.created_utc = 1640995200.0
+            mock_submission.subreddit.display_name = "python"
+            mock_submission.author = None
+            mock_submission.permalink = "/r/python/comments/test123"
+            mock_submission.is_self = True
+            mock_submission.link_flair_text = None
+            
+            mock_reddit.return_value.submission.return_value = mock_submission
+            
+            processor = RedditProcessor()
+            post = processor.fetch_post_by_id("test123")
+            
+            mock_reddit.return_value.submission.assert_called_once_with(id="test123")
+            assert isinstance(post, RedditPost)
+            assert post.id == "test123"
+            assert post.subreddit == "python"
+            assert post.author == "[deleted]"
+
+            # Comments come from the submission already loaded above
+            mock_submission.comments = MagicMock()
+            mock_submission.comments.__getitem__.return_value = []
+            assert processor.fetch_comments("test123") == []
+            mock_reddit.return_value.submission.assert_called_once_with(id="test123")
+
     @patch('src.reddit_processor.praw.Reddit')
     def test_fetch_comments_returns_list_of_reddit_comments(self, mock_reddit: Mock) -> None:
         """Test that fetch_comments returns a list of RedditComment objects."""
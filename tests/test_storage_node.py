@@ -8,7 +8,9 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 import json
 
-from src.orchestrator.nodes.storage import StorageNode
+import numpy as np
+
+from src.orchestrator.nodes.storage import StorageNode, dequantize_embedding, quantize_embedding
 from src.orchestrator.state import ContentState, create_content_state
 
 
@@ -22,11 +24,11 @@ class TestStorageNode:
         mock_table = Mock()
         mock_client.table.return_value = mock_table
         
-        # Mock successful insert
+        # Mock successful upsert
         mock_response = Mock()
         mock_response.data = [{"id": "test-content-id", "status": "completed"}]
         mock_response.error = None
-        mock_table.insert.return_value.execute.return_value = mock_response
+        mock_table.upsert.return_value.execute.return_value = mock_response
         
         # Mock successful update
         mock_table.update.return_value.eq.return_value.execute.return_value = mock_response
@@ -90,7 +92,7 @@ class TestStorageNode:
         mock_response = Mock()
         mock_response.data = [{"id": "stored-content-id"}]
         mock_response.error = None
-        mock_supabase_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        mock_supabase_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         result = storage_node.store_content(sample_content_state)
         
@@ -101,10 +103,12 @@ class TestStorageNode:
         
         # Verify Supabase calls
         mock_supabase_client.table.assert_called_with("content")
-        mock_supabase_client.table.return_value.insert.assert_called_once()
+        mock_supabase_client.table.return_value.upsert.assert_called_once()
+        upsert_args = mock_supabase_client.table.return_value.upsert.call_args
+        assert upsert_args.kwargs["on_conflict"] == "source_type,content_id"
         
-        # Verify the data structure passed to insert
-        insert_call_args = mock_supabase_client.table.return_value.insert.call_args[0][0]
+        # Verify the data structure passed to upsert
+        insert_call_args = upsert_args[0][0]
         assert insert_call_args["source_type"] == "youtube"
         assert insert_call_args["source_url"] == "https://youtube.com/watch?v=test123"
         assert insert_call_args["content_id"] == "test123"
@@ -117,7 +121,7 @@ class TestStorageNode:
         mock_response = Mock()
         mock_response.data = None
         mock_response.error = {"message": "Database error", "code": "42P01"}
-        mock_supabase_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        mock_supabase_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         with pytest.raises(Exception, match="Failed to store content"):
             storage_node.store_content(sample_content_state)
@@ -198,17 +202,21 @@ class TestStorageNode:
             {"id": "2", "content_id": "2"}
         ]
         mock_response.error = None
-        mock_supabase_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        mock_supabase_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         results = storage_node.batch_store(content_states)
         
         assert len(results) == 2
         assert all(r["status"] == "completed" for r in results)
         
-        # Verify batch insert call
-        mock_supabase_client.table.return_value.insert.assert_called_once()
-        insert_data = mock_supabase_client.table.return_value.insert.call_args[0][0]
+        # Verify batch upsert call, idempotent per source and id
+        mock_supabase_client.table.return_value.upsert.assert_called_once()
+        upsert_args = mock_supabase_client.table.return_value.upsert.call_args
+        assert upsert_args.kwargs["on_conflict"] == "source_type,content_id"
+        insert_data = upsert_args[0][0]
         assert len(insert_data) == 2
+        assert insert_data[0]["updated_at"] == insert_data[1]["updated_at"]
+        assert results[0]["stored_at"] == results[1]["stored_at"] == insert_data[0]["updated_at"]
 
     def test_get_content_by_source_url(self, storage_node, mock_supabase_client):
         """Test retrieving content by source URL."""
@@ -239,10 +247,33 @@ class TestStorageNode:
         assert "status" in prepared
         assert "created_at" in prepared
         
-        # Metadata should be JSON string
-        assert isinstance(prepared["metadata"], str)
-        metadata = json.loads(prepared["metadata"])
-        assert metadata["title"] == "Test Video"
+        # Metadata is passed through as a dict for the JSONB column
+        assert prepared["metadata"] == {"title": "Test Video", "duration": 300}
+        assert json.loads(json.dumps(prepared))["metadata"]["title"] == "Test Video"
+
+    def test_quantize_embeddings_adds_int8_column(self, mock_supabase_client, sample_content_state):
+        """Test that opting in stores an int8 copy of the embeddings."""
+        with patch('src.orchestrator.nodes.storage.supabase_client') as mock_client_module:
+            mock_client_module.get_client.return_value = mock_supabase_client
+            node = StorageNode(quantize_embeddings=True)
+        
+        prepared = node._prepare_content_for_storage(sample_content_state)
+        
+        assert prepared["embeddings"] == [0.1, 0.2, 0.3]
+        assert prepared["embeddings_int8"]["scale"] == pytest.approx(0.3)
+        np.testing.assert_allclose(
+            dequantize_embedding(prepared["embeddings_int8"]), [0.1, 0.2, 0.3], atol=0.3 / 127
+        )
+
+    def test_quantize_embedding_round_trip(self):
+        """Test int8 quantization error stays within half a quantization step."""
+        vector = np.random.default_rng(0).normal(size=1536).astype(np.float32)
+        
+        restored = dequantize_embedding(quantize_embedding(vector.tolist()))
+        
+        assert restored.dtype == np.float32
+        assert np.abs(restored - vector).max() <= np.abs(vector).max() / 127 / 2 + 1e-6
+        assert quantize_embedding([0.0, 0.0])["scale"] == 0.0
 
     def test_handle_storage_error_gracefully(self, storage_node, sample_content_state, mock_supabase_client):
         """Test graceful error handling during storage operations."""
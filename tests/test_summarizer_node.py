@@ -4,6 +4,9 @@ This module tests the SummarizerNode which uses DeepSeek API
 via LangChain to generate content summaries.
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from src.orchestrator.state import ContentState, create_content_state
@@ -11,6 +14,20 @@ from src.orchestrator.nodes.summarizer import SummarizerNode
 from unittest.mock import ANY
 
 
+def _reddit_states(count):
+    """Build ``count`` distinct Reddit states with short raw content."""
+    states = []
+    for i in range(count):
+        state = create_content_state(
+            source_type="reddit",
+            source_url=f"https://reddit.com/r/test/{i}",
+            content_id=f"test{i}"
+        )
+        state["raw_content"] = f"Reddit thread {i}"
+        states.append(state)
+    return states
+
+
 class TestSummarizerNode:
     """Test suite for SummarizerNode following TDD principles."""
 
@@ -40,7 +57,8 @@ class TestSummarizerNode:
             model="deepseek-chat",
             base_url="https://api.deepseek.com/v1",
             api_key=ANY,
-            temperature=0.3
+            temperature=0.3,
+            http_client=ANY
         )
 
     @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
@@ -58,7 +76,8 @@ class TestSummarizerNode:
             model="deepseek-chat",
             base_url="https://api.deepseek.com/v1",
             api_key='test-key',
-            temperature=0.3
+            temperature=0.3,
+            http_client=ANY
         )
 
     @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
@@ -217,7 +236,8 @@ class TestSummarizerNode:
             base_url="https://api.deepseek.com/v1",
             api_key=ANY,
             temperature=0.3,
-            max_tokens=2000
+            max_tokens=2000,
+            http_client=ANY
         )
 
     @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
@@ -247,4 +267,344 @@ class TestSummarizerNode:
         call_args = mock_llm.invoke.call_args[0][0]
         
         # Verify prompt includes the content
-        assert "Very long content" in str(call_args) 
\ No newline at end of file
+        assert "Very long content" in str(call_args) 
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summarizer_acall_overlaps_requests(self, mock_chat_openai):
+        """Test that acall awaits ainvoke so summaries can run concurrently."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_ainvoke(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(content="Async summary")
+        
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+        mock_chat_openai.return_value = mock_llm
+        
+        states = _reddit_states(3)
+        
+        node = SummarizerNode()
+        
+        async def run_all():
+            return await asyncio.gather(*(node.acall(state) for state in states))
+        
+        results = asyncio.run(run_all())
+        
+        assert peak == 3
+        assert all(r["summary"] == "Async summary" for r in results)
+        assert all(r["status"] == "summarized" for r in results)
+        mock_llm.invoke.assert_not_called()
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summarizer_acall_handles_api_errors(self, mock_chat_openai):
+        """Test that acall reports API errors in state like __call__."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=Exception("DeepSeek API error"))
+        mock_chat_openai.return_value = mock_llm
+        
+        state = create_content_state(
+            source_type="youtube",
+            source_url="https://youtube.com/watch?v=test123",
+            content_id="test123"
+        )
+        state["raw_content"] = "Test content for summarization..."
+        
+        result = asyncio.run(SummarizerNode().acall(state))
+        
+        assert result["status"] == "error"
+        assert "DeepSeek API error" in result["error_message"]
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summarize_batch_groups_items_into_one_request(self, mock_chat_openai):
+        """Test that summarize_batch sends one request per source/length group."""
+        def fake_invoke(messages):
+            prompt = messages[0].content
+            count = prompt.count("### Item ")
+            return Mock(content="\n".join(
+                f"=== SUMMARY {i} ===\nSummary {i} of {count}" for i in range(1, count + 1)
+            ))
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = fake_invoke
+        mock_chat_openai.return_value = mock_llm
+        
+        states = []
+        for i, source_type in enumerate(["youtube", "reddit", "youtube", "youtube"]):
+            state = create_content_state(
+                source_type=source_type,
+                source_url=f"https://example.com/{i}",
+                content_id=f"test{i}"
+            )
+            state["raw_content"] = f"Short content {i}" if i != 3 else ""
+            states.append(state)
+        
+        results = SummarizerNode().summarize_batch(states)
+        
+        assert mock_llm.invoke.call_count == 2
+        assert [r["summary"] for r in results[:3]] == ["Summary 1 of 2", "Summary 1 of 1", "Summary 2 of 2"]
+        assert all(r["status"] == "summarized" for r in results[:3])
+        assert results[3]["status"] == "error"
+        assert "empty" in results[3]["error_message"].lower()
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summarize_batch_marks_items_missing_from_reply(self, mock_chat_openai):
+        """Test that items without a delimited summary in the reply become errors."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=Mock(content="=== SUMMARY 2 ===\nOnly the second"))
+        mock_chat_openai.return_value = mock_llm
+        
+        states = _reddit_states(2)
+        
+        results = asyncio.run(SummarizerNode().asummarize_batch(states))
+        
+        mock_llm.ainvoke.assert_awaited_once()
+        assert results[0]["status"] == "error"
+        assert "item 1" in results[0]["error_message"]
+        assert results[1]["summary"] == "Only the second"
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summarize_batch_bounds_request_size(self, mock_chat_openai):
+        """Test that groups respect the character budget and long items go alone."""
+        def fake_invoke(messages, **kwargs):
+            count = messages[0].content.count("### Item ")
+            return Mock(content="\n".join(f"=== SUMMARY {i} ===\nSummary {i}" for i in range(1, count + 1)))
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = fake_invoke
+        mock_chat_openai.return_value = mock_llm
+        
+        lengths = [8000, 8000, 8000, 12000, 12000]
+        states = []
+        for i, length in enumerate(lengths):
+            state = create_content_state(
+                source_type="youtube",
+                source_url=f"https://youtube.com/watch?v={i}",
+                content_id=f"test{i}"
+            )
+            state["raw_content"] = str(i) * length
+            states.append(state)
+        
+        results = SummarizerNode(max_tokens=500).summarize_batch(states)
+        
+        item_counts = [call.args[0][0].content.count("### Item ") for call in mock_llm.invoke.call_args_list]
+        assert sorted(item_counts) == [1, 1, 1, 2]
+        token_caps = [call.kwargs.get("max_tokens") for call in mock_llm.invoke.call_args_list]
+        assert sorted(token_caps, key=str) == [1000, None, None, None]
+        assert all(r["status"] == "summarized" for r in results)
+
+    @pytest.mark.parametrize("length, expected", [
+        (1000, "brief summary in 1 paragraph"),
+        (1001, "concise summary in 1-2 paragraphs"),
+        (5000, "concise summary in 1-2 paragraphs"),
+        (5001, "detailed summary in 2-3 paragraphs"),
+        (10000, "detailed summary in 2-3 paragraphs"),
+        (10001, "comprehensive summary in 3-4 paragraphs"),
+    ])
+    def test_summary_prompt_length_buckets(self, length, expected):
+        """Test that prompt length instructions switch just above each threshold."""
+        prompt = SummarizerNode()._create_summary_prompt({"source_type": "reddit"}, "x" * length)
+        
+        assert expected in prompt
+        assert "This is Reddit content." in prompt
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_async_llm_is_reused_within_a_session(self, mock_chat_openai):
+        """Test that async calls share one client per session, which is closed on exit."""
+        mock_chat_openai.side_effect = lambda **kwargs: Mock()
+        node = SummarizerNode()
+        
+        async def two_lookups():
+            async with node.async_session() as session:
+                async with node.async_session() as nested:
+                    assert nested is session
+                return node._async_llm(session), node._async_llm(session), session.client
+        
+        first, again, first_client = asyncio.run(two_lookups())
+        second, _, _ = asyncio.run(two_lookups())
+        
+        assert first is again
+        assert first is not second
+        assert first_client.is_closed
+        assert mock_chat_openai.call_args.kwargs["http_async_client"] is not first_client
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_summary_cache_skips_llm_for_repeated_content(self, mock_chat_openai, tmp_path):
+        """Test that identical content (up to whitespace) reuses the cached summary."""
+        from src.orchestrator.optimization import ContentCache
+        
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Cached summary")
+        mock_chat_openai.return_value = mock_llm
+        with ContentCache(cache_dir=str(tmp_path), max_age_hours=1, max_items=10) as cache:
+            first = create_content_state(
+                source_type="reddit",
+                source_url="https://reddit.com/r/test/1",
+                content_id="test1"
+            )
+            first["raw_content"] = "Same thread text\nacross two posts"
+            second = create_content_state(
+                source_type="reddit",
+                source_url="https://reddit.com/r/other/2",
+                content_id="test2"
+            )
+            second["raw_content"] = "Same thread text   across two posts "
+            
+            assert SummarizerNode(summary_cache=cache)(first)["summary"] == "Cached summary"
+            result = SummarizerNode(summary_cache=cache)(second)
+            
+            assert result["summary"] == "Cached summary"
+            assert result["content_id"] == "test2"
+            mock_llm.invoke.assert_called_once()
+            
+            # Different generation settings must not reuse the summary
+            SummarizerNode(summary_cache=cache, temperature=0.7)(second)
+            assert mock_llm.invoke.call_count == 2
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_async_paths_use_async_summary_cache(self, mock_chat_openai):
+        """Test that acall and asummarize_batch read and write the cache off the loop."""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=Mock(content="=== SUMMARY 1 ===\nFresh summary"))
+        mock_chat_openai.return_value = mock_llm
+        cache = Mock()
+        cache.aget = AsyncMock(side_effect=["Cached summary", None])
+        cache.aset = AsyncMock()
+        
+        states = _reddit_states(2)
+        
+        node = SummarizerNode(summary_cache=cache)
+        assert asyncio.run(node.acall(states[0]))["summary"] == "Cached summary"
+        results = asyncio.run(node.asummarize_batch(states[1:]))
+        
+        assert results[0]["summary"] == "Fresh summary"
+        cache.aset.assert_awaited_once_with("summary", ANY, "Fresh summary", ANY)
+        cache.get.assert_not_called()
+        cache.set.assert_not_called()
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_astream_call_accumulates_chunks(self, mock_chat_openai):
+        """Test that astream_call joins streamed chunks and reports each one."""
+        async def fake_astream(messages):
+            for piece in ["First ", "", "second."]:
+                yield Mock(content=piece)
+        
+        mock_llm = Mock()
+        mock_llm.astream = fake_astream
+        mock_chat_openai.return_value = mock_llm
+        
+        state = create_content_state(
+            source_type="youtube",
+            source_url="https://youtube.com/watch?v=test123",
+            content_id="test123"
+        )
+        state["raw_content"] = "Transcript text"
+        seen = []
+        
+        result = asyncio.run(SummarizerNode().astream_call(state, on_chunk=seen.append))
+        
+        assert result["summary"] == "First second."
+        assert result["status"] == "summarized"
+        assert seen == ["First ", "second."]
+
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_astream_call_stops_at_timeout(self, mock_chat_openai):
+        """Test that a stalled stream is abandoned once the timeout passes."""
+        async def stalled_astream(messages):
+            yield Mock(content="Partial")
+            await asyncio.sleep(10)
+            yield Mock(content=" never")
+        
+        mock_llm = Mock()
+        mock_llm.astream = stalled_astream
+        mock_chat_openai.return_value = mock_llm
+        
+        state = create_content_state(
+            source_type="youtube",
+            source_url="https://youtube.com/watch?v=test123",
+            content_id="test123"
+        )
+        state["raw_content"] = "Transcript text"
+        
+        result = asyncio.run(SummarizerNode().astream_call(state, timeout=0.05))
+        
+        assert result["status"] == "error"
+        assert "exceeded 0.05s" in result["error_message"]
+
+    @patch('src.orchestrator.nodes.summarizer.app_config.DEEPSEEK_CONCURRENCY', 2)
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_async_requests_are_capped_per_account(self, mock_chat_openai):
+        """Test that concurrent acalls across nodes share one in-flight cap."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_ainvoke(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(content="Summary")
+        
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+        mock_chat_openai.return_value = mock_llm
+        
+        nodes = [SummarizerNode(api_key="shared-key") for _ in range(3)]
+        states = _reddit_states(6)
+        
+        async def run_all():
+            return await asyncio.gather(*(
+                nodes[i % 3].acall(state) for i, state in enumerate(states)
+            ))
+        
+        results = asyncio.run(run_all())
+        
+        assert peak == 2
+        assert all(r["status"] == "summarized" for r in results)
+
+    @patch('src.orchestrator.nodes.summarizer.app_config.DEEPSEEK_CONCURRENCY', 2)
+    @patch('src.orchestrator.nodes.summarizer.ChatOpenAI')
+    def test_async_request_cap_is_shared_across_threads(self, mock_chat_openai):
+        """Test that acalls on separate threads and event loops share one in-flight cap."""
+        counter_lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        
+        async def fake_ainvoke(messages):
+            nonlocal in_flight, peak
+            with counter_lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            with counter_lock:
+                in_flight -= 1
+            return Mock(content="Summary")
+        
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+        mock_chat_openai.return_value = mock_llm
+        
+        node = SummarizerNode(api_key="threaded-key")
+        states = _reddit_states(6)
+        results = []
+        
+        def run_half(half):
+            async def run_all():
+                return await asyncio.gather(*(node.acall(state) for state in half))
+            results.extend(asyncio.run(run_all()))
+        
+        threads = [threading.Thread(target=run_half, args=(states[i::2],)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert peak == 2
+        assert len(results) == 6
+        assert all(r["status"] == "summarized" for r in results)
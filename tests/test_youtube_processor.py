@@ -134,6 +134,18 @@ def test_transcribe_audio_success(mock_whisper_model, processor):
     # Check that the transcript is correctly joined from the segments
     assert transcript == "Hello world."
 
+@patch('src.youtube_processor.faster_whisper.WhisperModel')
+def test_transcribe_audio_reuses_loaded_model(mock_whisper_model, processor):
+    """The Whisper model is loaded once per size and reused across transcriptions."""
+    mock_whisper_model.return_value.transcribe.return_value = ([MagicMock(text="Hi.")], MagicMock())
+
+    processor.transcribe_audio("/tmp/first.mp3", "base")
+    processor.transcribe_audio("/tmp/second.mp3", "base")
+    processor.transcribe_audio("/tmp/third.mp3", "tiny")
+
+    assert [c.args for c in mock_whisper_model.call_args_list] == [("base",), ("tiny",)]
+    assert mock_whisper_model.return_value.transcribe.call_count == 3
+
 @patch('src.youtube_processor.subprocess.run')
 @patch('src.youtube_processor.os.path.exists')
 def test_speed_up_audio_success(mock_exists, mock_subprocess_run, processor):